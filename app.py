@@ -1,8 +1,6 @@
 # File: app.py
 
 import streamlit as st
-from src.categories.data_explorer import show as show_data_explorer
-from src.categories.volatility_risk import show as show_volatility_risk
 
 st.set_page_config(page_title="Electricity Dashboard", layout="wide")
 
@@ -13,9 +11,13 @@ menu = st.sidebar.radio(
      "Causality & Policy Influence", "Simulation & Scenario Analysis")
 )
 
+# Pages are imported only when selected: the volatility page pulls in
+# statsmodels, scipy and arch, which the other pages shouldn't pay for on startup
 if menu == "Data Explorer":
+    from src.categories.data_explorer import show as show_data_explorer
     show_data_explorer()
 elif menu == "Volatility & Risk":
+    from src.categories.volatility_risk import show as show_volatility_risk
     show_volatility_risk()
 else:
     st.info("Other categories will be implemented next.")
@@ -4,7 +4,16 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime, time
-from src.fetching.elexon_client import ElexonApiClient
+from src.fetching.elexon_client import ElexonApiClient, fetch_or_empty
+from src.utils.timestamps import parse_utc, settlement_to_utc
+
+# MID fields the price tab reads; the rest of the payload is dropped up front
+MID_COLUMNS = ("settlementDate", "settlementPeriod", "price", "volume", "local_datetime")
+
+
+def _fetch_or_empty(client: ElexonApiClient, key: str, **kwargs) -> pd.DataFrame:
+    """fetch_or_empty, with a failed request shown on the page."""
+    return fetch_or_empty(client, key, on_error=lambda e: st.error(str(e)), **kwargs)
 
 
 def show():
@@ -74,7 +83,8 @@ def show():
         st.header("APX Day-Ahead Price & Actual Total Load")
 
         # 1) Fetch MID stream, filter APXMIDP
-        df_mid = client.call_endpoint(
+        df_mid = _fetch_or_empty(
+            client,
             "datasets/MID/stream",
             path_params={"dataset": "MID"},
             query_params={"from": from_str, "to": to_str}
@@ -82,25 +92,23 @@ def show():
         if df_mid.empty:
             st.warning("MID endpoint returned no data for this window.")
         else:
-            # Filter only APXMIDP rows
+            # Filter only APXMIDP rows, keeping just the columns used below
+            mid_cols = [col for col in MID_COLUMNS if col in df_mid.columns]
             if "dataProvider" in df_mid.columns:
-                df_apx = df_mid[df_mid["dataProvider"] == "APXMIDP"].copy()
+                df_apx = df_mid.loc[df_mid["dataProvider"] == "APXMIDP", mid_cols].copy()
             else:
-                df_apx = df_mid.copy()
+                df_apx = df_mid[mid_cols].copy()
 
             if df_apx.empty:
                 st.warning("No APXMIDP rows found in this window.")
             else:
                 # Build datetime index
                 if "local_datetime" in df_apx.columns:
-                    df_apx["ts"] = pd.to_datetime(df_apx["local_datetime"], utc=True)
+                    df_apx["ts"] = parse_utc(df_apx["local_datetime"])
                 else:
-                    df_apx["settDate"] = pd.to_datetime(df_apx["settlementDate"])
-                    df_apx["ts"] = (
-                        df_apx["settDate"]
-                        + pd.to_timedelta((df_apx["settlementPeriod"] - 1) * 30, unit="m")
+                    df_apx["ts"] = settlement_to_utc(
+                        df_apx["settlementDate"], df_apx["settlementPeriod"]
                     )
-                    df_apx["ts"] = df_apx["ts"].dt.tz_localize("UTC")
                 df_apx.set_index("ts", inplace=True)
                 df_apx.sort_index(inplace=True)
 
@@ -140,7 +148,8 @@ def show():
         st.subheader("Actual Total Load (ATL / B0610)")
 
         # Use the demand/actual/total endpoint which provides the actual total load data
-        df_atl = client.call_endpoint(
+        df_atl = _fetch_or_empty(
+            client,
             "demand/actual/total",
             query_params={"from": from_str, "to": to_str}
         )
@@ -149,16 +158,13 @@ def show():
         else:
             # Convert to datetime index
             if "startTime" in df_atl.columns:
-                df_atl["ts"] = pd.to_datetime(df_atl["startTime"], utc=True)
+                df_atl["ts"] = parse_utc(df_atl["startTime"])
             elif "local_datetime" in df_atl.columns:
-                df_atl["ts"] = pd.to_datetime(df_atl["local_datetime"], utc=True)
+                df_atl["ts"] = parse_utc(df_atl["local_datetime"])
             else:
-                df_atl["settDate"] = pd.to_datetime(df_atl["settlementDate"])
-                df_atl["ts"] = (
-                    df_atl["settDate"]
-                    + pd.to_timedelta((df_atl["settlementPeriod"] - 1) * 30, unit="m")
+                df_atl["ts"] = settlement_to_utc(
+                    df_atl["settlementDate"], df_atl["settlementPeriod"]
                 )
-                df_atl["ts"] = df_atl["ts"].dt.tz_localize("UTC")
             df_atl.set_index("ts", inplace=True)
             df_atl.sort_index(inplace=True)
 
@@ -196,7 +202,8 @@ def show():
         st.header("Actual Wind & Solar Generation (AGWS / B1630)")
 
         # Use the generation/actual/per-type/wind-and-solar endpoint instead of AGWS dataset
-        df_agws = client.call_endpoint(
+        df_agws = _fetch_or_empty(
+            client,
             "generation/actual/per-type/wind-and-solar",
             query_params={"from": from_str, "to": to_str}
         )
@@ -205,18 +212,15 @@ def show():
         else:
             # Convert to datetime index
             if "startTime" in df_agws.columns:
-                df_agws["ts"] = pd.to_datetime(df_agws["startTime"], utc=True)
+                df_agws["ts"] = parse_utc(df_agws["startTime"])
                 df_agws.set_index("ts", inplace=True)
             elif "local_datetime" in df_agws.columns:
-                df_agws["ts"] = pd.to_datetime(df_agws["local_datetime"], utc=True)
+                df_agws["ts"] = parse_utc(df_agws["local_datetime"])
                 df_agws.set_index("ts", inplace=True)
             elif "settlementDate" in df_agws.columns and "settlementPeriod" in df_agws.columns:
-                df_agws["settDate"] = pd.to_datetime(df_agws["settlementDate"])
-                df_agws["ts"] = (
-                    df_agws["settDate"]
-                    + pd.to_timedelta((df_agws["settlementPeriod"] - 1) * 30, unit="m")
+                df_agws["ts"] = settlement_to_utc(
+                    df_agws["settlementDate"], df_agws["settlementPeriod"]
                 )
-                df_agws["ts"] = df_agws["ts"].dt.tz_localize("UTC")
                 df_agws.set_index("ts", inplace=True)
             
             df_agws.sort_index(inplace=True)
@@ -226,24 +230,21 @@ def show():
 
             # Process the wind and solar data based on businessType and psrType
             if "businessType" in df_agws.columns and "psrType" in df_agws.columns:
-                # Create a pivot table to sum up quantities by timestamp and fuel type
-                df_agws_reset = df_agws.reset_index()
-                pivot_agws = df_agws_reset.pivot_table(
-                    values="quantity", 
-                    index="ts", 
-                    columns="psrType", 
-                    aggfunc="sum"
-                ).fillna(0)
+                # Sum quantities by timestamp and fuel type; grouping on a
+                # categorical psrType hashes small integer codes, not strings
+                psr_type = df_agws["psrType"].astype("category")
+                pivot_agws = (
+                    df_agws.groupby(["ts", psr_type], observed=True)["quantity"]
+                    .sum()
+                    .unstack("psrType", fill_value=0)
+                )
                 
-                # Create a combined Wind+Solar column
-                if "Wind Offshore" in pivot_agws.columns and "Wind Onshore" in pivot_agws.columns:
-                    pivot_agws["Wind Total"] = pivot_agws["Wind Offshore"] + pivot_agws["Wind Onshore"]
-                
-                if "Solar" in pivot_agws.columns:
-                    if "Wind Total" in pivot_agws.columns:
-                        pivot_agws["Wind+Solar"] = pivot_agws["Wind Total"] + pivot_agws["Solar"]
-                    elif "Wind Offshore" in pivot_agws.columns and "Wind Onshore" in pivot_agws.columns:
-                        pivot_agws["Wind+Solar"] = pivot_agws["Wind Offshore"] + pivot_agws["Wind Onshore"] + pivot_agws["Solar"]
+                # Wind Total / Wind+Solar from one NumPy sum over the wind columns
+                if {"Wind Offshore", "Wind Onshore"} <= set(pivot_agws.columns):
+                    wind = pivot_agws[["Wind Offshore", "Wind Onshore"]].to_numpy().sum(axis=1)
+                    pivot_agws["Wind Total"] = wind
+                    if "Solar" in pivot_agws.columns:
+                        pivot_agws["Wind+Solar"] = wind + pivot_agws["Solar"].to_numpy()
                 
                 # Reset index for display
                 display_df = pivot_agws.reset_index()
@@ -300,7 +301,8 @@ def show():
         st.header("Fuel-Type Generation Outturn (FUELHH / B1630)")
 
         # Fix: Use generation/actual/per-type endpoint instead of FUELHH/stream
-        df_fuel = client.call_endpoint(
+        df_fuel = _fetch_or_empty(
+            client,
             "generation/actual/per-type",
             query_params={"from": from_str, "to": to_str}
         )
@@ -308,33 +310,30 @@ def show():
             st.warning("No FUELHH data returned.")
         else:
             # Process the nested 'data' column structure
-            if 'data' in df_fuel.columns and isinstance(df_fuel.iloc[0]['data'], list):
-                # Extract the list of dicts from the 'data' column
-                expanded_data = []
-                for idx, row in df_fuel.iterrows():
-                    base_data = {'startTime': row['startTime'], 'settlementPeriod': row['settlementPeriod']}
-                    for item in row['data']:
-                        entry = base_data.copy()
-                        entry.update(item)
-                        expanded_data.append(entry)
-                
-                # Create a new DataFrame with the expanded data
-                df_fuel = pd.DataFrame(expanded_data)
+            if 'data' in df_fuel.columns and pd.api.types.is_list_like(df_fuel.iloc[0]['data']):
+                # One row per item of each period's 'data' list, alongside that
+                # period's startTime / settlementPeriod
+                exp = (
+                    df_fuel[["startTime", "settlementPeriod", "data"]]
+                    .explode("data")
+                    .dropna(subset=["data"])
+                    .reset_index(drop=True)
+                )
+                df_fuel = pd.concat(
+                    [exp.drop(columns="data"), pd.json_normalize(exp["data"].tolist())], axis=1
+                )
                 
             # Convert to datetime index
             if "startTime" in df_fuel.columns:
-                df_fuel["ts"] = pd.to_datetime(df_fuel["startTime"], utc=True)
+                df_fuel["ts"] = parse_utc(df_fuel["startTime"])
                 df_fuel.set_index("ts", inplace=True)
             elif "local_datetime" in df_fuel.columns:
-                df_fuel["ts"] = pd.to_datetime(df_fuel["local_datetime"], utc=True)
+                df_fuel["ts"] = parse_utc(df_fuel["local_datetime"])
                 df_fuel.set_index("ts", inplace=True)
             elif "settlementDate" in df_fuel.columns and "settlementPeriod" in df_fuel.columns:
-                df_fuel["settDate"] = pd.to_datetime(df_fuel["settlementDate"])
-                df_fuel["ts"] = (
-                    df_fuel["settDate"]
-                    + pd.to_timedelta((df_fuel["settlementPeriod"] - 1) * 30, unit="m")
+                df_fuel["ts"] = settlement_to_utc(
+                    df_fuel["settlementDate"], df_fuel["settlementPeriod"]
                 )
-                df_fuel["ts"] = df_fuel["ts"].dt.tz_localize("UTC")
                 df_fuel.set_index("ts", inplace=True)
             
             df_fuel.sort_index(inplace=True)
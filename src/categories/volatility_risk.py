@@ -23,6 +23,13 @@ except ImportError:
     ARCH_AVAILABLE = False
 
 from src.fetching.elexon_client import ElexonApiClient
+from src.utils.timestamps import settlement_to_utc
+
+# (time column, settlement period column, price column) per dataset, so the
+# price series can be located without scanning the frame's columns/dtypes.
+PRICE_SCHEMA = {
+    'MID': ('settlementDate', 'settlementPeriod', 'price'),
+}
 
 
 def safe_api_call(client, dataset, start_time, end_time, max_retries=3):
@@ -43,13 +50,23 @@ def safe_api_call(client, dataset, start_time, end_time, max_retries=3):
 
 def calculate_returns(prices, return_type='log'):
     """Calculate returns from price series"""
-    if return_type == 'log':
-        returns = np.log(prices / prices.shift(1))
-    else:
-        returns = prices.pct_change()
-    return returns.dropna()
+    # Ratio of consecutive prices on the raw array: no shift/alignment pass
+    arr = prices.to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = arr[1:] / arr[:-1]
+        values = np.log(ratio) if return_type == 'log' else ratio - 1
+    return pd.Series(values, index=prices.index[1:], name=prices.name).dropna()
+
+
+# The analyses below are pure functions of the returns series, so they are
+# cached across Streamlit reruns: changing an unrelated widget (e.g. the VaR
+# levels) no longer refits the tests and GARCH models from scratch. The inputs
+# move with the date window, so the caches are bounded in size and age.
+_CACHE_TTL = 60 * 60  # seconds
+_CACHE_MAX_ENTRIES = 32
 
 
+@st.cache_data(show_spinner=False, ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 def calculate_volatility_metrics(returns):
     """Calculate comprehensive volatility and risk metrics"""
     metrics = {}
@@ -76,6 +93,7 @@ def calculate_volatility_metrics(returns):
     return metrics
 
 
+@st.cache_data(show_spinner=False, ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 def perform_statistical_tests(returns):
     """Perform statistical tests on returns"""
     results = {}
@@ -106,32 +124,32 @@ def perform_statistical_tests(returns):
     return results
 
 
+# Fitted results are read-only, no need to copy them
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 def fit_garch_models(returns):
-    """Fit GARCH family models"""
+    """
+    Fit GARCH family models. A failed fit raises (and so is not cached); the
+    caller reports it.
+    """
     if not ARCH_AVAILABLE:
         return None
     
     models = {}
     
-    try:
-        # GARCH(1,1)
-        garch = arch_model(returns.dropna() * 100, vol='Garch', p=1, q=1)
-        garch_fit = garch.fit(disp='off')
-        models['GARCH'] = garch_fit
-        
-        # EGARCH(1,1)
-        egarch = arch_model(returns.dropna() * 100, vol='EGARCH', p=1, q=1)
-        egarch_fit = egarch.fit(disp='off')
-        models['EGARCH'] = egarch_fit
-        
-        # GJR-GARCH(1,1)
-        gjr = arch_model(returns.dropna() * 100, vol='GARCH', p=1, o=1, q=1)
-        gjr_fit = gjr.fit(disp='off')
-        models['GJR-GARCH'] = gjr_fit
-        
-    except Exception as e:
-        st.error(f"Error fitting GARCH models: {str(e)}")
-        return None
+    # GARCH(1,1)
+    garch = arch_model(returns.dropna() * 100, vol='Garch', p=1, q=1)
+    garch_fit = garch.fit(disp='off')
+    models['GARCH'] = garch_fit
+    
+    # EGARCH(1,1)
+    egarch = arch_model(returns.dropna() * 100, vol='EGARCH', p=1, q=1)
+    egarch_fit = egarch.fit(disp='off')
+    models['EGARCH'] = egarch_fit
+    
+    # GJR-GARCH(1,1)
+    gjr = arch_model(returns.dropna() * 100, vol='GARCH', p=1, o=1, q=1)
+    gjr_fit = gjr.fit(disp='off')
+    models['GJR-GARCH'] = gjr_fit
     
     return models
 
@@ -337,13 +355,16 @@ def show():
     # Process the data
     try:
         df = pd.DataFrame(price_data)
-        if 'settlementDate' in df.columns and 'settlementPeriod' in df.columns:
-            # Convert settlement date and period to datetime
-            df['datetime'] = pd.to_datetime(df['settlementDate']) + pd.to_timedelta((df['settlementPeriod'] - 1) * 30, unit='minutes')
+        date_col, period_col, price_col = PRICE_SCHEMA['MID']
+        if date_col in df.columns and period_col in df.columns:
+            # Convert settlement date and period to datetime; the index stays
+            # tz-naive (UTC wall time), as the resampling and charts expect
+            df['datetime'] = settlement_to_utc(df[date_col], df[period_col]).dt.tz_localize(None)
             df = df.set_index('datetime').sort_index()
         
-        # Get price column
-        price_col = 'price' if 'price' in df.columns else df.select_dtypes(include=[np.number]).columns[0]
+        # Payloads without the expected price column fall back to the first numeric one
+        if price_col not in df.columns:
+            price_col = df.select_dtypes(include=[np.number]).columns[0]
         prices = df[price_col].dropna()
         
         if len(prices) < 10:
@@ -425,7 +446,11 @@ def show():
         st.markdown("## 🎯 GARCH Volatility Models")
         
         with st.spinner("Fitting GARCH models..."):
-            garch_models = fit_garch_models(returns)
+            try:
+                garch_models = fit_garch_models(returns)
+            except Exception as e:
+                st.error(f"Error fitting GARCH models: {str(e)}")
+                garch_models = None
         
         if garch_models:
             # Model comparison
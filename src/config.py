@@ -1,9 +1,21 @@
+import logging
 import os
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Helper to get typed environment variables
+def get_env_var(var_name, default_value, var_type=str):
+    value = os.getenv(var_name, default_value)
+    try:
+        return var_type(value)
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            "Could not cast environment variable %s to %s. Using default: %s", var_name, var_type, default_value
+        )
+        return default_value
+
 # API Keys & Data Source Configuration
 ENTSOE_API_KEY = os.getenv("ENTSOE_API_KEY")
 ELEXON_API_KEY = os.getenv("ELEXON_API_KEY")
@@ -26,6 +38,10 @@ ENTSOE_OUT_DOMAIN = os.getenv("ENTSOE_OUT_DOMAIN", "10YGB----------A")
 # ELEXON Specific Parameters
 ELEXON_DAYAHEAD_AUCTION_ENDPOINT_PATH = os.getenv("ELEXON_DAYAHEAD_AUCTION_ENDPOINT_PATH", "/datasets/DayAheadAuction/stream")
 ELEXON_AVG_SYSTEM_PRICES_ENDPOINT_PATH = os.getenv("ELEXON_AVG_SYSTEM_PRICES_ENDPOINT_PATH", "/balancing/system-prices/average")
+ELEXON_CONNECT_TIMEOUT = get_env_var("ELEXON_CONNECT_TIMEOUT", 5.0, float)  # seconds
+ELEXON_READ_TIMEOUT = get_env_var("ELEXON_READ_TIMEOUT", 30.0, float)  # seconds, between bytes
+ELEXON_MAX_RETRIES = get_env_var("ELEXON_MAX_RETRIES", 5, int)  # per request, with backoff
+ELEXON_MEMO_MAX_MB = get_env_var("ELEXON_MEMO_MAX_MB", 256.0, float)  # in-memory result memo, all endpoints
 
 
 # EIA Specific Parameters
@@ -53,15 +69,6 @@ MOCK_PRICE_MAX = float(os.getenv("MOCK_PRICE_MAX", "70.0"))
 # File Operations
 DEFAULT_SAVE_PATH = os.getenv("DEFAULT_SAVE_PATH", "data/raw")
 
-# Helper to get typed environment variables
-def get_env_var(var_name, default_value, var_type=str):
-    value = os.getenv(var_name, default_value)
-    try:
-        return var_type(value)
-    except ValueError:
-        print(f"Warning: Could not cast environment variable {var_name} to {var_type}. Using default: {default_value}")
-        return default_value
-
 # Example of re-defining a variable using the helper for robust type casting, if preferred:
 # ANALYSIS_VOLATILITY_WINDOW_SIZE = get_env_var("ANALYSIS_VOLATILITY_WINDOW_SIZE", "24", int)
 
@@ -1,11 +1,305 @@
 # File: src/fetching/elexon_client.py
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from pathlib import Path
+from types import MappingProxyType
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from itertools import islice
+import hashlib
+import inspect
+import io
+import json
+import logging
+import math
+import pickle
+import re
+import sys
+import threading
+import time
+from urllib.parse import urlencode
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import src.config as config  # Assumes ELEXON_API_KEY is defined here
 
+# Incremental JSON parsing for large /stream payloads
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Faster JSON decoding of whole response bodies
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Without orjson, fall back to the ujson decoder bundled with pandas, which is
+# still quicker than the stdlib json module on large bodies
+try:
+    from pandas.io.json import ujson_loads
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+# Columnar (Arrow) results for callers writing Parquet / handing off to DuckDB
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Polars frames, for call_endpoint(..., return_type="polars")
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Shared HTTP session: every client reuses the same keep-alive connection pool,
+# so repeated calls to data.elexon.co.uk skip the TCP + TLS handshake, and
+# transient throttling / gateway errors are retried with backoff.
+# ────────────────────────────────────────────────────────────────────────────────
+
+class ElexonFetchError(Exception):
+    """
+    A BMRS request failed for good: retries were exhausted, the API rejected the
+    request, or the response body wasn't valid JSON.
+    """
+
+# Keep-alive connections kept per host. Everything goes to one host, so this is
+# the number of requests that can be in flight without opening (and then
+# discarding) an extra TLS connection.
+_POOL_MAXSIZE = 32
+
+# (connect, read) timeout for every request, so a stalled upstream fails into
+# the retry policy instead of hanging a worker (and the page) indefinitely
+_TIMEOUT = (config.ELEXON_CONNECT_TIMEOUT, config.ELEXON_READ_TIMEOUT)
+
+
+def _build_session() -> requests.Session:
+    # requests' default Accept-Encoding already offers gzip/deflate, plus br when
+    # brotli is installed; urllib3 decodes whichever comes back
+    session = requests.Session()
+    retry = Retry(
+        total=config.ELEXON_MAX_RETRIES,
+        backoff_factor=0.5,
+        backoff_jitter=0.25,  # spread out retries from concurrent workers
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+# Default concurrency of the bulk helpers; leaves pool headroom for other callers
+_MAX_WORKERS = _POOL_MAXSIZE // 2
+
+# Threads turning fetched bodies into DataFrames in call_endpoints_bulk
+_ASSEMBLY_WORKERS = 2
+
+# Rows decoded per DataFrame batch when streaming a response body
+_STREAM_BATCH_ROWS = 10_000
+
+
+# Seconds a response may be served from the on-disk cache, by endpoint-key
+# prefix. Endpoints not listed here are always fetched live.
+CACHE_TTL_SECONDS: Dict[str, float] = {
+    "reference/": 24 * 60 * 60,
+    "datasets/metadata/latest": 10 * 60,
+}
+
+# Recent settlement data is still being published (and revised); cache it for
+# half an hour
+CURRENT_SETTLEMENT_TTL = 30 * 60
+
+# Settlement dates (and time windows ending on dates) at least this many days
+# before today (UTC) are treated as final and cached indefinitely
+SETTLED_AFTER_DAYS = 2
+
+# Query params that end a requested time window
+_WINDOW_END_PARAMS = ("to", "settlementDateTo", "publishDateTimeTo")
+
+
+def _cache_ttl(key: str, path_params: Dict[str, Any], query_params: Dict[str, Any]) -> float:
+    """
+    How long (seconds) a response for this call stays fresh on disk; 0 means
+    don't cache. Settlement dates - and time windows ending on dates - at least
+    SETTLED_AFTER_DAYS before today (UTC) are final, so they are kept
+    indefinitely. More recent settlement dates, and windows that ended yesterday,
+    may still be filling in and are kept for CURRENT_SETTLEMENT_TTL.
+    """
+    today = datetime.now(timezone.utc).date()
+    settled = (today - timedelta(days=SETTLED_AFTER_DAYS)).isoformat()
+    today = today.isoformat()
+    settlement_date = path_params.get("settlementDate") or query_params.get("settlementDate")
+    if settlement_date:
+        settlement_date = str(settlement_date)[:10]
+        if settlement_date <= settled:
+            return math.inf
+        if settlement_date <= today:
+            return CURRENT_SETTLEMENT_TTL
+    window_end = next((query_params[p] for p in _WINDOW_END_PARAMS if query_params.get(p)), None)
+    if window_end:
+        window_end = str(window_end)[:10]
+        if window_end <= settled:
+            return math.inf
+        if window_end < today:
+            return CURRENT_SETTLEMENT_TTL
+    for prefix, ttl in CACHE_TTL_SECONDS.items():
+        if key.startswith(prefix):
+            return ttl
+    return 0
+
+
+# Seconds a call_endpoint result is reused from memory, by endpoint-key prefix
+# (first match wins); anything else is reused for MEMO_DEFAULT_TTL seconds.
+MEMO_TTL_SECONDS: Dict[str, float] = {
+    "health": 60,
+    "demand/peak": 60 * 60,
+    "forecast/availability/weekly": 15 * 60,
+    "generation/outturn": 5 * 60,
+    "demand/outturn": 10 * 60,
+    "forecast/": 10 * 60,
+}
+MEMO_DEFAULT_TTL = 30
+
+
+def _memo_ttl(key: str) -> float:
+    for prefix, ttl in MEMO_TTL_SECONDS.items():
+        if key.startswith(prefix):
+            return ttl
+    return MEMO_DEFAULT_TTL
+
+
+class _ResultMemo:
+    """
+    Process-wide, thread-safe store of recent call_endpoint results, shared by all
+    clients (Streamlit builds a new client on every rerun). Entries are kept past
+    their TTL, so a stale copy is still there to fall back on if the API is down,
+    and evicted in least-recently-stored order once there are more than `maxsize`
+    of them or they hold more than `max_bytes` in total (deep memory usage).
+    """
+
+    def __init__(self, maxsize: int = 2048, max_bytes: int = 256 * 2**20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[float, pd.DataFrame, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, ttl: float, allow_stale: bool = False) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, df, _ = entry
+        if not allow_stale and time.monotonic() - stored_at >= ttl:
+            return None
+        return df.copy(deep=False)  # callers add columns; keep the stored frame intact
+
+    def put(self, key: Tuple, df: pd.DataFrame) -> None:
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[2]
+            self._entries[key] = (time.monotonic(), df.copy(deep=False), nbytes)
+            self._nbytes += nbytes
+            # Always keep the entry just stored, even if it alone is over max_bytes
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.maxsize or self._nbytes > self.max_bytes
+            ):
+                self._nbytes -= self._entries.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+_MEMO = _ResultMemo(max_bytes=int(config.ELEXON_MEMO_MAX_MB * 2**20))
+
+# call_endpoint requests currently on the wire, keyed like _MEMO
+_INFLIGHT: Dict[Tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _query_string(query_params: Optional[Dict[str, Any]]) -> str:
+    """
+    Canonical encoded query string: keys sorted, None values dropped (requests
+    would drop them anyway), list values repeated. Used as-is both on the wire and
+    in cache keys, so equivalent calls share entries and nothing is encoded twice.
+    """
+    if not query_params:
+        return ""
+    return _encode_query(tuple(sorted(
+        (k, tuple(v) if isinstance(v, (list, tuple)) else str(v))
+        for k, v in query_params.items() if v is not None
+    )))
+
+
+@lru_cache(maxsize=4096)
+def _encode_query(items: Tuple[Tuple[str, Any], ...]) -> str:
+    return urlencode(items, doseq=True)
+
+
+def _loads(body: bytes) -> Any:
+    """
+    Decode a JSON body with orjson when installed, else pandas' bundled ujson,
+    else the stdlib (raises ValueError on bad JSON).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    if UJSON_AVAILABLE:
+        return ujson_loads(body, precise_float=True)
+    return json.loads(body)
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared session used by every ElexonApiClient, so callers can
+    mount their own adapters (retry policy, pool size) before fetching.
+    """
+    return _SESSION
+
+
+def fetch_or_empty(
+    client: "ElexonApiClient",
+    key: str,
+    on_error: Optional[Callable[[ElexonFetchError], Any]] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    client.call_endpoint(key, **kwargs), but a failed request yields an empty frame,
+    so one unavailable dataset doesn't take down a page or a report over several.
+    The error is passed to `on_error` (e.g. st.error, print), or logged if none.
+    """
+    try:
+        return client.call_endpoint(key, **kwargs)
+    except ElexonFetchError as e:
+        if on_error is None:
+            logger.warning("%s", e)
+        else:
+            on_error(e)
+        return pd.DataFrame()
+
 
 # ────────────────────────────────────────────────────────────────────────────────
 # ENTIRE LIST OF ENDPOINTS (all categories), keyed by a friendly name.
@@ -352,6 +646,245 @@ ENDPOINTS: Dict[str, str] = {
     "temperature": "/temperature"
 }
 
+# Read-only from here on; keys and templates interned since they're looked up constantly
+ENDPOINTS = MappingProxyType({sys.intern(k): sys.intern(v) for k, v in ENDPOINTS.items()})
+
+_ENDPOINT_KEYS = frozenset(ENDPOINTS)
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Path parameters each URI template needs; templates with none are already the final path
+_PLACEHOLDERS: Dict[str, frozenset] = {
+    key: frozenset(_PLACEHOLDER_RE.findall(uri)) for key, uri in ENDPOINTS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_url(url_template: str, key: str, path_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Fill in a full-URL template for endpoint `key`. `path_items` is the sorted item
+    tuple of the path params, so repeated calls (polling loops) are a cache lookup.
+    """
+    required = _PLACEHOLDERS[key]
+    if not required:
+        return url_template
+    path_params = dict(path_items)
+    missing = required - path_params.keys()
+    if missing:
+        names = ", ".join(f"'{name}'" for name in sorted(missing))
+        raise ValueError(f"Missing path parameter(s) {names} for endpoint '{key}'")
+    return url_template.format_map(path_params)
+
+
+# Settlement periods as strings (1-48, up to 50 on clock-change days), so the
+# wrappers and sweeps index a table instead of calling str() per request
+_SP_STR: Tuple[str, ...] = tuple(str(i) for i in range(51))
+
+
+def _sp_str(period: Any) -> str:
+    """A settlement period as a string: from _SP_STR for ints 0-50, else str()."""
+    if type(period) is int and 0 <= period <= 50:
+        return _SP_STR[period]
+    return str(period)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Column/dtype hints for the endpoints the dashboards read most. Records from
+# these are built with a fixed column list and cast once, instead of letting
+# pandas infer every column row by row. Endpoints not listed keep the inferred
+# frame as-is.
+# ────────────────────────────────────────────────────────────────────────────────
+
+_UTC = "datetime64[ns, UTC]"
+
+DTYPES: Dict[str, Dict[str, str]] = {
+    "datasets/MID/stream": {
+        "dataset": "object",
+        "startTime": _UTC,
+        "dataProvider": "category",
+        "settlementDate": "object",
+        "settlementPeriod": "int64",
+        "price": "float64",
+        "volume": "float64",
+    },
+    "demand/actual/total": {
+        "publishTime": _UTC,
+        "startTime": _UTC,
+        "settlementDate": "object",
+        "settlementPeriod": "int64",
+        "quantity": "float64",
+    },
+    "generation/actual/per-type/wind-and-solar": {
+        "publishTime": _UTC,
+        "businessType": "category",
+        "psrType": "category",
+        "quantity": "float64",
+        "startTime": _UTC,
+        "settlementDate": "object",
+        "settlementPeriod": "int64",
+    },
+}
+
+DTYPES = MappingProxyType({
+    sys.intern(key): MappingProxyType(dtypes) for key, dtypes in DTYPES.items()
+})
+
+SCHEMAS: Mapping[str, List[str]] = MappingProxyType({key: list(dtypes) for key, dtypes in DTYPES.items()})
+
+
+# Low-cardinality code columns, stored as categoricals whichever endpoint they
+# come from (a handful of distinct strings repeated on every row)
+CATEGORY_COLUMNS = frozenset({"bidOffer", "bmUnit", "fuelType", "psrType", "businessType", "dataProvider"})
+
+
+# Endpoint families whose numbers (prices in £/MWh, volumes in MWh) fit in 32 bits;
+# their float64/int64 columns are narrowed to float32/int32 to halve their size.
+DOWNCAST_PREFIXES = (
+    "balancing/settlement/system-prices",
+    "balancing/settlement/indicative/cashflows",
+    "generation/outturn",
+)
+
+
+def _downcasts(endpoint: Optional[str]) -> bool:
+    return endpoint is not None and endpoint.startswith(DOWNCAST_PREFIXES)
+
+
+def _records_to_frame(records: List[Dict[str, Any]], endpoint: Optional[str]) -> pd.DataFrame:
+    """DataFrame from a list of records, using the endpoint's column list when known."""
+    columns = SCHEMAS.get(endpoint)
+    if columns is None:
+        return pd.DataFrame(records)
+    return pd.DataFrame.from_records(records, columns=columns)
+
+
+def _apply_dtypes(df: pd.DataFrame, endpoint: Optional[str]) -> pd.DataFrame:
+    """
+    Cast a freshly built frame to the endpoint's registered dtypes. Timestamps are
+    parsed with an explicit ISO 8601 format. If the payload doesn't fit the hints
+    (missing values in an integer column, say) the frame is returned untouched.
+    Any CATEGORY_COLUMNS present become categoricals, registered endpoint or not.
+    """
+    if df.empty:
+        return df
+    for col in CATEGORY_COLUMNS.intersection(df.columns):
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            try:
+                df[col] = df[col].astype("category")
+            except TypeError:  # unhashable values (nested lists/dicts)
+                pass
+    if _downcasts(endpoint):
+        narrow = {"float64": "float32", "int64": "int32"}
+        df = df.astype(
+            {col: narrow[str(dtype)] for col, dtype in df.dtypes.items() if str(dtype) in narrow}
+        )
+    dtypes = DTYPES.get(endpoint)
+    if not dtypes:
+        return df
+    plain = {col: dtype for col, dtype in dtypes.items() if dtype != _UTC and col in df.columns}
+    try:
+        df = df.astype(plain)
+    except (ValueError, TypeError):
+        return df
+    for col, dtype in dtypes.items():
+        if dtype == _UTC and col in df.columns:
+            df[col] = pd.to_datetime(df[col], format="ISO8601", utc=True, cache=True)
+    return df
+
+
+def _buffered_body(response: requests.Response) -> io.BufferedReader:
+    """Peekable reader over a streamed response's decompressed body."""
+    response.raw.decode_content = True
+    # Keep the raw stream readable at EOF so the buffered wrapper can drain it
+    response.raw.auto_close = False
+    return io.BufferedReader(response.raw)
+
+
+def _records_from_payload(payload: Any) -> Optional[List[Dict[str, Any]]]:
+    """The record list of a list / {"data": [...]} payload; None for any other shape."""
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict) and isinstance(payload.get("data"), list):
+        return payload["data"]
+    return None
+
+
+def _table_from_records(records: List[Dict[str, Any]]) -> "pa.Table":
+    """
+    Arrow table with a column for every key found in `records` (missing values
+    become nulls), like pd.DataFrame(records). pa.Table.from_pylist alone would
+    take the columns from the first record only.
+    """
+    columns = dict.fromkeys(key for record in records for key in record)
+    return pa.Table.from_pydict({col: [record.get(col) for record in records] for col in columns})
+
+
+def _records_to_table(records: List[Dict[str, Any]], endpoint: Optional[str]) -> "pa.Table":
+    """
+    Arrow table from a list of records, typed from DTYPES when the endpoint has an
+    entry (timestamps arrive as ISO 8601 strings and are cast afterwards).
+    Raises pa.ArrowInvalid / ArrowTypeError for fields Arrow can't type (mixed
+    types across records).
+    """
+    dtypes = DTYPES.get(endpoint)
+    if not dtypes:
+        return _compact_table(_table_from_records(records), endpoint)
+    arrow_types = {
+        "object": pa.string(), "category": pa.dictionary(pa.int32(), pa.string()),
+        "int64": pa.int64(), "float64": pa.float64(), _UTC: pa.string(),
+    }
+    try:
+        table = pa.Table.from_pylist(
+            records, schema=pa.schema([(col, arrow_types[dtype]) for col, dtype in dtypes.items()])
+        )
+        for i, (col, dtype) in enumerate(dtypes.items()):
+            if dtype == _UTC:
+                table = table.set_column(i, col, table[col].cast(pa.timestamp("ns", tz="UTC")))
+    except (ValueError, TypeError):  # pa.ArrowInvalid / ArrowTypeError: records don't fit the hints
+        return _compact_table(_table_from_records(records), endpoint)
+    return table
+
+
+def _table_to_pandas(table: "pa.Table", consume: bool = False) -> pd.DataFrame:
+    """
+    DataFrame from an Arrow table, with nested (list / struct) columns as Python
+    lists and dicts - the same values a frame built from the decoded JSON holds.
+    A plain to_pandas() would give NumPy arrays for lists.
+    With consume=True the table's buffers are released as they are converted;
+    the table must not be used afterwards.
+    """
+    nested = {
+        field.name: table[field.name].to_pylist()
+        for field in table.schema if pa.types.is_nested(field.type)
+    }
+    df = table.to_pandas(split_blocks=consume, self_destruct=consume)
+    for col, values in nested.items():
+        df[col] = pd.Series(values, index=df.index, dtype=object)
+    return df
+
+
+def _read_parquet(path: Path) -> pd.DataFrame:
+    """Read a cached Parquet frame (see `_table_to_pandas`)."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to read Parquet cache entries")
+    return _table_to_pandas(pq.read_table(path), consume=True)
+
+
+def _compact_table(table: "pa.Table", endpoint: Optional[str]) -> "pa.Table":
+    """
+    Arrow counterpart of the generic part of `_apply_dtypes`: dictionary-encode the
+    CATEGORY_COLUMNS string columns and narrow numbers for DOWNCAST_PREFIXES.
+    """
+    downcast = _downcasts(endpoint)
+    for i, field in enumerate(table.schema):
+        if field.name in CATEGORY_COLUMNS and pa.types.is_string(field.type):
+            table = table.set_column(i, field.name, table.column(i).dictionary_encode())
+        elif downcast and field.type == pa.float64():
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float32()))
+        elif downcast and field.type == pa.int64():
+            table = table.set_column(i, field.name, table.column(i).cast(pa.int32()))
+    return table
+
 
 class ElexonApiClient:
     """
@@ -360,84 +893,222 @@ class ElexonApiClient:
     and `kwargs` fill in the URI template’s placeholders or query parameters.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    __slots__ = (
+        "api_key", "base_url", "session", "_headers", "_url_templates",
+        "use_cache", "stale_fallback", "raw_dir", "proc_dir",
+    )
+
+    RAW_DIR = Path("data/raw")
+    PROC_DIR = Path("data/processed")
+    _dirs_ready = False
+
+    # What call_endpoint and the generated wrappers return when no return_type is
+    # given: "pandas", "arrow" (pyarrow Table) or "polars". Set on the class to
+    # switch a whole pipeline over.
+    default_return_type = "pandas"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_cache: bool = True,
+        session: Optional[requests.Session] = None,
+        stale_fallback: bool = True,
+    ):
         self.api_key = api_key or config.ELEXON_API_KEY
         if not self.api_key:
             raise ValueError("Elexon API key must be provided (argument or in config).")
         self.base_url = "https://data.elexon.co.uk/bmrs/api/v1"
+        # The process-wide pooled session unless the caller supplies their own
+        self.session = session if session is not None else _SESSION
+        # Built once; the API key stays per-client rather than on the shared session
+        self._headers = {"apiKey": self.api_key, "Accept": "application/json"}
+        # Full-URL templates, built once; endpoints without placeholders are final URLs
+        self._url_templates = {key: self.base_url + uri for key, uri in ENDPOINTS.items()}
+        self.use_cache = use_cache
+        self.stale_fallback = stale_fallback
+
+        # Caching directories (raw responses / processed outputs)
+        self.raw_dir = self.RAW_DIR
+        self.proc_dir = self.PROC_DIR
+        self._ensure_dirs()
+
+    def close(self) -> None:
+        """
+        Release the connection pool of a session passed in to this client.
+        The shared session outlives any one client and is left open.
+        """
+        if self.session is not _SESSION:
+            self.session.close()
+
+    def __enter__(self) -> "ElexonApiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @classmethod
+    def _ensure_dirs(cls) -> None:
+        """Create the caching directories once per process rather than per client."""
+        if cls._dirs_ready:
+            return
+        cls.RAW_DIR.mkdir(parents=True, exist_ok=True)
+        cls.PROC_DIR.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ready = True
+
+    def _fetch(
+        self, url: str, params: str, endpoint: Optional[str] = None
+    ) -> Union[bytes, pd.DataFrame]:
+        """
+        I/O half of a request: GET url (see `_url_for`) with the encoded query string
+        `params` (see `_query_string`) and header {"apiKey": self.api_key},
+        returning the raw body for `_assemble`.
+
+        `/stream` endpoints are the exception: with ijson installed they are parsed
+        incrementally off the socket (see `_frame_from_stream`), so a finished
+        DataFrame comes back instead.
+        Raises ElexonFetchError once the session's retries are exhausted, on a
+        non-retryable HTTP error, or on a malformed streamed body.
+        """
+        stream = IJSON_AVAILABLE and url.endswith("/stream")
+        try:
+            response = self.session.get(
+                url, headers=self._headers, params=params, timeout=_TIMEOUT, stream=stream
+            )
+            response.raise_for_status()
+            if not stream:
+                return response.content
+            with response:
+                return _apply_dtypes(self._frame_from_stream(response, url, endpoint), endpoint)
+
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            raise ElexonFetchError(f"Error fetching {url} with params={params}: {e}") from e
+        except ValueError as e:
+            raise ElexonFetchError(f"Error parsing JSON from {url}: {e}") from e
 
-        # Optionally, set up caching directories if you want raw/pickle or parquet caching:
-        self.raw_dir = Path("data/raw")
-        self.proc_dir = Path("data/processed")
-        self.raw_dir.mkdir(parents=True, exist_ok=True)
-        self.proc_dir.mkdir(parents=True, exist_ok=True)
+    def _assemble(
+        self,
+        body: Union[bytes, pd.DataFrame],
+        url: str,
+        endpoint: Optional[str] = None,
+        cache_file: Optional[Path] = None,
+    ) -> pd.DataFrame:
+        """
+        CPU half of a request: decode a body from `_fetch` and shape it with
+        `_frame_from_payload`. When `endpoint` has an entry in DTYPES, the frame is
+        built with its column list and cast to its dtypes. Non-empty results are
+        written to the on-disk cache when `cache_file` is given (see `_write_cache`).
+        """
+        if isinstance(body, pd.DataFrame):
+            df = body
+        else:
+            try:
+                df = _apply_dtypes(self._frame_from_payload(_loads(body), url, endpoint), endpoint)
+            except ValueError as e:
+                raise ElexonFetchError(f"Error parsing JSON from {url}: {e}") from e
+
+        if cache_file is not None and not df.empty:  # may just not be published yet; don't pin it
+            self._write_cache(cache_file, df)
+        return df
+
+    def _frame_from_stream(
+        self, response: requests.Response, url: str, endpoint: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Parse a streamed response body with ijson rather than buffering it whole.
+        Records of a top-level JSON array are decoded as they arrive and converted in
+        batches of _STREAM_BATCH_ROWS, so the full body text and the full list of
+        dicts never have to be held at the same time. With pyarrow installed each
+        batch becomes a columnar Arrow table and the tables are converted to pandas
+        once at the end; batches Arrow can't type (mixed-type fields) drop the
+        whole response back to per-batch DataFrames.
+        Any other payload shape is decoded in full and passed to `_frame_from_payload`.
+        """
+        body = _buffered_body(response)
+        if body.peek(1).lstrip()[:1] != b"[":
+            return self._frame_from_payload(_loads(body.read()), url, endpoint)
+
+        rows = ijson.items(body, "item", use_float=True)
+        tables: List["pa.Table"] = []
+        frames: List[pd.DataFrame] = []
+        try:
+            while True:
+                batch = list(islice(rows, _STREAM_BATCH_ROWS))
+                if not batch:
+                    break
+                if PYARROW_AVAILABLE and not frames:
+                    try:
+                        tables.append(_records_to_table(batch, endpoint))
+                        continue
+                    except (pa.ArrowException, ValueError, TypeError):
+                        frames = [_table_to_pandas(table) for table in tables]
+                        tables = []
+                frames.append(_records_to_frame(batch, endpoint))
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+        if tables:
+            try:
+                combined = pa.concat_tables(tables, promote_options="permissive")
+                return _table_to_pandas(combined, consume=True)
+            except pa.ArrowException:  # batches whose column types can't be unified
+                frames = [_table_to_pandas(table) for table in tables]
+        if not frames:
+            return pd.DataFrame()
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
 
-    def _get(self, path: str, params: Dict[str, Any]) -> pd.DataFrame:
+    def _frame_from_payload(
+        self, payload: Any, url: str, endpoint: Optional[str] = None
+    ) -> pd.DataFrame:
         """
-        Internal helper to do a GET at self.base_url + path, with query params=params
-        and header {"apiKey": self.api_key}. Returns DataFrame from JSON payload.
-        
+        Build a DataFrame from a decoded JSON payload.
+
         Handles multiple response formats:
         - List of data objects
         - Dict with 'data' key containing a list
         - Dict with 'data' key containing a dict
         - Dict without 'data' key (treated as a single record)
         """
-        url = f"{self.base_url}{path}"
-        headers = {"apiKey": self.api_key}
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            payload = response.json()
-            
-            # Case 1: Direct list of data objects
-            if isinstance(payload, list):
-                return pd.DataFrame(payload)
-            
-            # Case 2: Dict response
-            elif isinstance(payload, dict):
-                # Case 2a: Has 'data' key containing list
-                if "data" in payload and isinstance(payload["data"], list):
-                    return pd.DataFrame(payload["data"])
-                    
-                # Case 2b: Has 'data' key containing dict
-                elif "data" in payload and isinstance(payload["data"], dict):
-                    data_value = payload["data"]
-                    # Check if the dict contains lists we should extract
-                    if any(isinstance(v, list) for v in data_value.values()):
-                        for key, value in data_value.items():
-                            if isinstance(value, list) and len(value) > 0:
-                                # Found a list, assume this is our data
-                                return pd.DataFrame(value)
-                        # If no lists with data found, return the dict as a single row
-                        return pd.DataFrame([data_value])
-                    else:
-                        # Simple dict data, return as single row
-                        return pd.DataFrame([data_value])
-                    
-                # Case 2c: Dict without 'data' key
+        # Case 1: Direct list of data objects
+        if isinstance(payload, list):
+            return _records_to_frame(payload, endpoint)
+
+        # Case 2: Dict response
+        elif isinstance(payload, dict):
+            # Case 2a: Has 'data' key containing list
+            if "data" in payload and isinstance(payload["data"], list):
+                return _records_to_frame(payload["data"], endpoint)
+
+            # Case 2b: Has 'data' key containing dict
+            elif "data" in payload and isinstance(payload["data"], dict):
+                data_value = payload["data"]
+                # Check if the dict contains lists we should extract
+                if any(isinstance(v, list) for v in data_value.values()):
+                    for key, value in data_value.items():
+                        if isinstance(value, list) and len(value) > 0:
+                            # Found a list, assume this is our data
+                            return pd.DataFrame(value)
+                    # If no lists with data found, return the dict as a single row
+                    return pd.DataFrame([data_value])
                 else:
-                    # Filter out common metadata keys if present
-                    metadata_keys = ["apiVersion", "batchSize", "totalRecords", "status", 
-                                    "serviceType", "elapsedTime"]
-                    
-                    # If it has typical data fields, treat as a data record
-                    if any(k for k in payload.keys() if k not in metadata_keys):
-                        return pd.DataFrame([payload])
-                    else:
-                        # If it's just metadata, return empty dataframe
-                        return pd.DataFrame()
-            
-            # Case 3: Unexpected format
+                    # Simple dict data, return as single row
+                    return pd.DataFrame([data_value])
+
+            # Case 2c: Dict without 'data' key
             else:
-                print(f"Warning: Unexpected response format from {url}")
-                return pd.DataFrame()
-                
-        except requests.RequestException as e:
-            print(f"Error fetching {url} with params={params}: {e}")
-            return pd.DataFrame()
-        except ValueError as e:
-            print(f"Error parsing JSON from {url}: {e}")
+                # Filter out common metadata keys if present
+                metadata_keys = ["apiVersion", "batchSize", "totalRecords", "status",
+                                "serviceType", "elapsedTime"]
+
+                # If it has typical data fields, treat as a data record
+                if any(k for k in payload.keys() if k not in metadata_keys):
+                    return pd.DataFrame([payload])
+                else:
+                    # If it's just metadata, return empty dataframe
+                    return pd.DataFrame()
+
+        # Case 3: Unexpected format
+        else:
+            logger.warning("Unexpected response format from %s", url)
             return pd.DataFrame()
 
     def call_endpoint(
@@ -445,26 +1116,447 @@ class ElexonApiClient:
         key: str,
         path_params: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-    ) -> pd.DataFrame:
+        return_type: Optional[str] = None,
+    ) -> Union[pd.DataFrame, "pa.Table", "pl.DataFrame"]:
         """
         Generic caller for any key in ENDPOINTS.
         - Handles both payloads that are top-level lists and payloads that are dicts with "data".
+        - Results are reused from memory for a short, per-endpoint TTL
+          (MEMO_TTL_SECONDS) unless the client was built with use_cache=False.
+        - Raises ElexonFetchError if the request still fails after retries, unless
+          stale_fallback is set and an earlier result for the same call is held.
+        - return_type "arrow" / "polars" (default: default_return_type) builds the
+          result from Arrow without going through pandas; those results skip the
+          in-memory memo and the stale fallback.
+        """
+        return_type = return_type or self.default_return_type
+        if return_type != "pandas":
+            return self._call_columnar(key, path_params, query_params, return_type)
+        if not self.use_cache:
+            return self._assemble(*self._fetch_endpoint(key, path_params, query_params))
+
+        # Clients with other credentials or another host must not share results
+        memo_key = (
+            self.base_url,
+            self.api_key,
+            key,
+            tuple(sorted((k, str(v)) for k, v in (path_params or {}).items())),
+            _query_string(query_params),
+        )
+        df = _MEMO.get(memo_key, _memo_ttl(key))
+        if df is not None:
+            return df
+
+        # Single flight: if another thread is already fetching this exact call,
+        # wait for its result instead of sending a duplicate request
+        with _INFLIGHT_LOCK:
+            pending = _INFLIGHT.get(memo_key)
+            owner = pending is None
+            if owner:
+                pending = _INFLIGHT[memo_key] = Future()
+        if not owner:
+            return pending.result().copy(deep=False)  # re-raises the owner's error
+
+        try:
+            df = self._call_uncached(key, path_params, query_params, memo_key)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            # Waiters copy from their own frame, never from the one handed back
+            # here, which the caller may already be adding columns to
+            pending.set_result(df.copy(deep=False))
+            return df
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[memo_key]
+
+    def _call_uncached(
+        self,
+        key: str,
+        path_params: Optional[Dict[str, Any]],
+        query_params: Optional[Dict[str, Any]],
+        memo_key: Tuple,
+    ) -> pd.DataFrame:
+        """Memo-miss path of `call_endpoint`: fetch, remember, or fall back to stale."""
+        try:
+            df = self._assemble(*self._fetch_endpoint(key, path_params, query_params))
+        except ElexonFetchError as e:
+            stale = _MEMO.get(memo_key, 0, allow_stale=True) if self.stale_fallback else None
+            if stale is None:
+                raise
+            logger.warning("Serving last known '%s' result; %s", key, e)
+            return stale
+        _MEMO.put(memo_key, df)
+        return df
+
+    def _fetch_endpoint(
+        self,
+        key: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Union[bytes, pd.DataFrame], str, str, Optional[Path]]:
         """
-        if key not in ENDPOINTS:
+        I/O half of `call_endpoint`: serve a fresh on-disk cache entry, or fetch the
+        body. Returns the arguments for `_assemble`.
+        """
+        if key not in _ENDPOINT_KEYS:
             raise KeyError(f"Endpoint '{key}' not found in ENDPOINTS.")
 
-        uri_template = ENDPOINTS[key]
         path_params = path_params or {}
+        url = self._url_for(key, path_params)
+
+        query = _query_string(query_params)
+        ttl = _cache_ttl(key, path_params, query_params or {}) if self.use_cache else 0
+        if not ttl:
+            return self._fetch(url, query, key), url, key, None
+
+        cache_file = self._cache_file(key, url, query)
+        cached = self._read_cache(cache_file, ttl)
+        if cached is not None:
+            return cached, url, key, None
+        return self._fetch(url, query, key), url, key, cache_file
+
+    def _call_columnar(
+        self,
+        key: str,
+        path_params: Optional[Dict[str, Any]],
+        query_params: Optional[Dict[str, Any]],
+        return_type: str,
+    ) -> Union["pa.Table", "pl.DataFrame"]:
+        """Arrow-backed branch of `call_endpoint` for return_type "arrow" / "polars"."""
+        if return_type == "arrow":
+            return self.call_endpoint_arrow(key, path_params, query_params)
+        if return_type == "polars":
+            if not POLARS_AVAILABLE:
+                raise ImportError("polars is required for return_type='polars'")
+            return pl.from_arrow(self.call_endpoint_arrow(key, path_params, query_params))
+        raise ValueError(f"return_type must be 'pandas', 'arrow' or 'polars', not {return_type!r}")
+
+    def call_endpoint_arrow(
+        self,
+        key: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+    ) -> "pa.Table":
+        """
+        Same as `call_endpoint`, but returns a pyarrow Table built straight from the
+        decoded records, skipping the object-dtype DataFrame in between. Call
+        `.to_pandas()` on the result if a DataFrame is wanted after all.
+        Requires pyarrow.
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for call_endpoint_arrow")
+
+        body, url, endpoint, cache_file = self._fetch_endpoint(key, path_params, query_params)
+        try:
+            return self._assemble_arrow(body, url, endpoint, cache_file)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ElexonFetchError(f"Can't build an Arrow table from {url}: {e}") from e
+
+    def _assemble_arrow(
+        self,
+        body: Union[bytes, pd.DataFrame],
+        url: str,
+        endpoint: Optional[str] = None,
+        cache_file: Optional[Path] = None,
+    ) -> "pa.Table":
+        """
+        Arrow counterpart of `_assemble`. Raises pa.ArrowInvalid / ArrowTypeError
+        when the records can't be typed as Arrow columns (mixed-type fields).
+        """
+        if isinstance(body, pd.DataFrame):  # cache hit or streamed body
+            return pa.Table.from_pandas(body, preserve_index=False)
+        try:
+            payload = _loads(body)
+        except ValueError as e:
+            raise ElexonFetchError(f"Error parsing JSON from {url}: {e}") from e
+
+        records = _records_from_payload(payload)
+        if records is None:
+            df = _apply_dtypes(self._frame_from_payload(payload, url, endpoint), endpoint)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        else:
+            table = _records_to_table(records, endpoint)
+        if cache_file is not None and table.num_rows:
+            self._write_cache(cache_file, table)
+        return table
+
+    def stream_rows(
+        self,
+        key: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of an endpoint's response one dict at a time, for
+        consumers that make a single pass over the rows (e.g. loading a database)
+        and don't need a DataFrame - use `call_endpoint` for that.
+
+        With ijson installed the body is parsed off the socket as it arrives, so
+        memory stays flat however large the response; the records are the items
+        of a top-level JSON array, or of the "data" list of a JSON object.
+        Bypasses the on-disk cache. Raises ElexonFetchError like `call_endpoint`.
+        """
+        if key not in _ENDPOINT_KEYS:
+            raise KeyError(f"Endpoint '{key}' not found in ENDPOINTS.")
+        url = self._url_for(key, path_params or {})
+        params = _query_string(query_params)
         try:
-            path = uri_template.format(**path_params)
-        except KeyError as e:
-            missing = e.args[0]
-            raise ValueError(f"Missing path parameter '{missing}' for endpoint '{key}'") from e
+            with self.session.get(
+                url, headers=self._headers, params=params, timeout=_TIMEOUT, stream=IJSON_AVAILABLE
+            ) as response:
+                response.raise_for_status()
+                if not IJSON_AVAILABLE:
+                    payload = _loads(response.content)
+                    records = _records_from_payload(payload)
+                    yield from [payload] if records is None else records
+                    return
+                body = _buffered_body(response)
+                prefix = "item" if body.peek(1).lstrip()[:1] == b"[" else "data.item"
+                try:
+                    yield from ijson.items(body, prefix, use_float=True)
+                except ijson.JSONError as e:
+                    raise ValueError(str(e)) from e
+
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            raise ElexonFetchError(f"Error fetching {url} with params={params}: {e}") from e
+        except ValueError as e:
+            raise ElexonFetchError(f"Error parsing JSON from {url}: {e}") from e
 
-        return self._get(path, params=query_params or {})
+    def iter_frames(
+        self,
+        key: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        batch_size: int = _STREAM_BATCH_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield an endpoint's records as DataFrames of up to `batch_size` rows, built
+        from `stream_rows`. The body is read lazily, one batch per iteration, so
+        only one batch of rows is held at a time; reading does not run ahead of the
+        consumer (the download pauses while a frame is being processed). For
+        large /stream responses that are processed chunk by chunk, or gathered with
+        `pd.concat(client.iter_frames(...), ignore_index=True)`.
+        """
+        rows = self.stream_rows(key, path_params, query_params)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield _apply_dtypes(_records_to_frame(batch, key), key)
+
+    def _url_for(self, key: str, path_params: Dict[str, Any]) -> str:
+        """Full request URL for an endpoint key with its path params filled in."""
+        url_template = self._url_templates[key]
+        if not _PLACEHOLDERS[key]:
+            return url_template
+        return _format_url(url_template, key, tuple(sorted(path_params.items())))
+
+    def _cache_file(self, key: str, url: str, query: str) -> Path:
+        """
+        On-disk cache location for a GET of `url` with query string `query`:
+        raw_dir/<endpoint key>/<hash>, without a suffix (see `_write_cache`).
+        """
+        digest = hashlib.blake2b(f"{url}?{query}".encode(), digest_size=16).hexdigest()
+        return self.raw_dir / re.sub(r"\W+", "_", key).strip("_") / digest
+
+    @staticmethod
+    def _read_cache(cache_file: Path, ttl: float) -> Optional[pd.DataFrame]:
+        """The cached frame at `cache_file` if younger than `ttl` seconds, else None."""
+        for suffix, read in ((".parquet", _read_parquet), (".pkl", pd.read_pickle)):
+            target = cache_file.with_suffix(suffix)
+            try:
+                if time.time() - target.stat().st_mtime < ttl:
+                    return read(target)
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError, ImportError):
+                continue  # missing, stale-format or unreadable entry
+        return None
+
+    @staticmethod
+    def _write_cache(cache_file: Path, data: Union[pd.DataFrame, "pa.Table"]) -> None:
+        """
+        Store a result under `cache_file`: zstd-compressed Parquet when pyarrow is
+        installed, pickle otherwise (or when the frame holds values Parquet can't
+        represent, e.g. mixed-type object columns).
+        """
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if PYARROW_AVAILABLE:
+            target = cache_file.with_suffix(".parquet")
+            try:
+                if isinstance(data, pd.DataFrame):
+                    data = pa.Table.from_pandas(data, preserve_index=False)
+                pq.write_table(data, target, compression="zstd", row_group_size=100_000)
+                return
+            except (pa.ArrowException, ValueError, TypeError):
+                target.unlink(missing_ok=True)
+                if isinstance(data, pa.Table):
+                    data = _table_to_pandas(data)
+        data.to_pickle(cache_file.with_suffix(".pkl"))
+
+    def call_endpoints_bulk(
+        self,
+        jobs: List[Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]],
+        max_workers: int = _MAX_WORKERS,
+    ) -> List[pd.DataFrame]:
+        """
+        Run many `call_endpoint` jobs concurrently; each job is a
+        (key, path_params, query_params) tuple. Returns one DataFrame per job,
+        in the same order as `jobs`.
+        - The calls are I/O-bound and share the pooled session, so N requests
+          take roughly ceil(N / max_workers) round trips instead of N.
+        - Responses are decoded and turned into DataFrames on a separate small
+          pool as they arrive, so the HTTP threads go straight on to the next
+          request instead of holding a connection slot during assembly.
+        """
+        if not jobs:
+            return []
+        # More threads than pooled connections would only churn TLS handshakes
+        max_workers = min(max_workers, _POOL_MAXSIZE, len(jobs))
+        # io_pool is the inner context so it shuts down (and its done callbacks
+        # have handed off to cpu_pool) before cpu_pool stops taking work
+        with ThreadPoolExecutor(max_workers=_ASSEMBLY_WORKERS) as cpu_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as io_pool:
+            results: List[Future] = [Future() for _ in jobs]
+
+            def assemble(i: int, fetch: Future) -> None:
+                try:
+                    results[i].set_result(self._assemble(*fetch.result()))
+                except BaseException as e:
+                    results[i].set_exception(e)
+
+            fetches = []
+            for i, (key, path_params, query_params) in enumerate(jobs):
+                fetch = io_pool.submit(self._fetch_endpoint, key, path_params, query_params)
+                fetch.add_done_callback(lambda f, i=i: cpu_pool.submit(assemble, i, f))
+                fetches.append(fetch)
+            try:
+                return [future.result() for future in results]
+            except BaseException:
+                for fetch in fetches:  # don't wait on requests whose results are discarded
+                    fetch.cancel()
+                raise
+
+    def fetch_many(
+        self,
+        calls: List[Callable[[], pd.DataFrame]],
+        max_workers: int = _MAX_WORKERS,
+    ) -> List[pd.DataFrame]:
+        """
+        Run zero-argument callables - typically bound wrapper calls - concurrently
+        on the shared connection pool and return their results in order, so
+        fetching N unrelated endpoints costs about one round trip, not N.
+
+        Example:
+            demand, prices = client.fetch_many([
+                client.get_demand_outturn_daily,
+                functools.partial(client.get_settlement_system_prices, "2024-01-01"),
+            ])
+        """
+        if not calls:
+            return []
+        workers = min(max_workers, _POOL_MAXSIZE, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
+    def call_endpoint_batch(
+        self,
+        key: str,
+        jobs: List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]],
+        max_workers: int = _MAX_WORKERS,
+    ) -> pd.DataFrame:
+        """
+        Sweep one endpoint over many (path_params, query_params) pairs - e.g. all 48
+        settlement periods of a day - concurrently, and return the results as a
+        single DataFrame (rows in job order).
+
+        Example:
+            client.call_endpoint_batch(
+                "balancing/acceptances/all",
+                [(None, {"settlementDate": "2024-01-01", "settlementPeriod": sp})
+                 for sp in range(1, 49)],
+            )
+
+        With pyarrow installed, each response becomes an Arrow table in its worker
+        thread (Arrow does that work without holding the GIL), and the tables are
+        concatenated and converted to pandas once at the end. A response Arrow
+        can't type (mixed-type fields) is built as a DataFrame instead.
+        """
+        if PYARROW_AVAILABLE and jobs:
+            def fetch(job: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]):
+                fetched = self._fetch_endpoint(key, *job)
+                try:
+                    return self._assemble_arrow(*fetched)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    return self._assemble(*fetched)
+
+            workers = min(max_workers, _POOL_MAXSIZE, len(jobs))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(fetch, jobs))
+            results = [r for r in results if (r.num_rows if isinstance(r, pa.Table) else len(r))]
+            if not results:
+                return pd.DataFrame()
+            if all(isinstance(r, pa.Table) for r in results):
+                try:
+                    combined = pa.concat_tables(results, promote_options="permissive")
+                    return _table_to_pandas(combined, consume=True)
+                except pa.ArrowException:  # column types that can't be unified
+                    pass
+            return pd.concat(
+                [_table_to_pandas(r) if isinstance(r, pa.Table) else r for r in results],
+                ignore_index=True,
+            )
+
+        frames = self.call_endpoints_bulk(
+            [(key, path_params, query_params) for path_params, query_params in jobs],
+            max_workers=max_workers,
+        )
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def fetch_settlement_range(
+        self,
+        key: str,
+        dates: Iterable[str],
+        periods: Optional[Iterable[int]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        max_workers: int = _MAX_WORKERS,
+    ) -> pd.DataFrame:
+        """
+        Fetch a settlement-period endpoint for every (date, period) pair - all 48
+        periods of each date by default - in one concurrent sweep, returned as a
+        single DataFrame. settlementDate/settlementPeriod go into the URI when the
+        endpoint's template has them, otherwise into the query string; any other
+        fixed path params (e.g. bidOffer) are passed via `path_params`.
+
+        Example:
+            client.fetch_settlement_range(
+                "balancing/settlement/stack/all/{bidOffer}/{settlementDate}/{settlementPeriod}",
+                ["2024-01-01", "2024-01-02"],
+                path_params={"bidOffer": "bid"},
+            )
+        """
+        if key not in _ENDPOINT_KEYS:
+            raise KeyError(f"Endpoint '{key}' not found in ENDPOINTS.")
+        # Both are looped over more than once; materialise one-shot iterables
+        dates = tuple(dates)
+        periods = tuple(periods) if periods is not None else range(1, 49)
+        in_path = _PLACEHOLDERS[key]
+
+        jobs = []
+        for date in dates:
+            for period in periods:
+                pair = {"settlementDate": date, "settlementPeriod": _sp_str(period)}
+                path = dict(path_params or {}, **{k: v for k, v in pair.items() if k in in_path})
+                query = {k: v for k, v in pair.items() if k not in in_path}
+                jobs.append((path, query))
+        return self.call_endpoint_batch(key, jobs, max_workers=max_workers)
 
     # ────────────────────────────────────────────────────────────────────────────────
     # For convenience, you can still define “wrapper” methods for the common patterns:
+    # (parameterless ones are generated from _SIMPLE_WRAPPERS at the end of the module)
     # ────────────────────────────────────────────────────────────────────────────────
 
     def get_dataset(self, dataset: str) -> pd.DataFrame:
@@ -536,13 +1628,6 @@ class ElexonApiClient:
             qp["to"] = to
         return self.call_endpoint(endpoint_key, query_params=qp)
 
-    def get_acceptances_all_latest(self) -> pd.DataFrame:
-        """
-        GET /balancing/acceptances/all/latest
-        """
-        endpoint_key = "balancing/acceptances/all/latest"
-        return self.call_endpoint(endpoint_key)
-
     def get_acceptances_all(
         self,
         settlementDate: str,
@@ -554,7 +1639,7 @@ class ElexonApiClient:
         endpoint_key = "balancing/acceptances/all"
         qp = {"settlementDate": settlementDate}
         if settlementPeriod is not None:
-            qp["settlementPeriod"] = str(settlementPeriod)
+            qp["settlementPeriod"] = _sp_str(settlementPeriod)
         return self.call_endpoint(endpoint_key, query_params=qp)
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -589,7 +1674,7 @@ class ElexonApiClient:
         endpoint_key = "balancing/bid-offer/all"
         qp = {"settlementDate": settlementDate}
         if settlementPeriod is not None:
-            qp["settlementPeriod"] = str(settlementPeriod)
+            qp["settlementPeriod"] = _sp_str(settlementPeriod)
         return self.call_endpoint(endpoint_key, query_params=qp)
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -617,7 +1702,7 @@ class ElexonApiClient:
         GET /balancing/dynamic/all?settlementDate={settlementDate}&settlementPeriod={settlementPeriod}
         """
         endpoint_key = "balancing/dynamic/all"
-        qp = {"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)}
+        qp = {"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)}
         return self.call_endpoint(endpoint_key, query_params=qp)
 
     def get_balancing_dynamic_rates_all(
@@ -629,7 +1714,7 @@ class ElexonApiClient:
         GET /balancing/dynamic/rates/all?settlementDate={settlementDate}&settlementPeriod={settlementPeriod}
         """
         endpoint_key = "balancing/dynamic/rates/all"
-        qp = {"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)}
+        qp = {"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)}
         return self.call_endpoint(endpoint_key, query_params=qp)
 
     def get_balancing_dynamic_rates(
@@ -658,7 +1743,7 @@ class ElexonApiClient:
         GET /balancing/physical/all?dataset={dataset}&settlementDate={settlementDate}&settlementPeriod={settlementPeriod}
         """
         endpoint_key = "balancing/physical/all"
-        qp = {"dataset": dataset, "settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)}
+        qp = {"dataset": dataset, "settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)}
         return self.call_endpoint(endpoint_key, query_params=qp)
 
     def get_balancing_physical(
@@ -691,7 +1776,7 @@ class ElexonApiClient:
         GET /balancing/nonbm/disbsad/details?settlementDate={settlementDate}&settlementPeriod={settlementPeriod}
         """
         endpoint_key = "balancing/nonbm/disbsad/details"
-        qp = {"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)}
+        qp = {"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)}
         return self.call_endpoint(endpoint_key, query_params=qp)
 
     def get_disbsad_summary(
@@ -730,62 +1815,6 @@ class ElexonApiClient:
     # 7) Explicit Wrappers for Demand
     # ────────────────────────────────────────────────────────────────────────────
 
-    def get_demand_actual_total(self) -> pd.DataFrame:
-        """
-        GET /demand/actual/total
-        """
-        endpoint_key = "demand/actual/total"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_outturn(self) -> pd.DataFrame:
-        """
-        GET /demand/outturn
-        """
-        endpoint_key = "demand/outturn"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_outturn_daily(self) -> pd.DataFrame:
-        """
-        GET /demand/outturn/daily
-        """
-        endpoint_key = "demand/outturn/daily"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_outturn_daily_stream(self) -> pd.DataFrame:
-        """
-        GET /demand/outturn/daily/stream
-        """
-        endpoint_key = "demand/outturn/daily/stream"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_outturn_stream(self) -> pd.DataFrame:
-        """
-        GET /demand/outturn/stream
-        """
-        endpoint_key = "demand/outturn/stream"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_outturn_summary(self) -> pd.DataFrame:
-        """
-        GET /demand/outturn/summary
-        """
-        endpoint_key = "demand/outturn/summary"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_peak(self) -> pd.DataFrame:
-        """
-        GET /demand/peak
-        """
-        endpoint_key = "demand/peak"
-        return self.call_endpoint(endpoint_key)
-
-    def get_demand_peak_indicative(self) -> pd.DataFrame:
-        """
-        GET /demand/peak/indicative
-        """
-        endpoint_key = "demand/peak/indicative"
-        return self.call_endpoint(endpoint_key)
-
     def get_demand_peak_indicative_operational(self, triadSeason: str) -> pd.DataFrame:
         """
         GET /demand/peak/indicative/operational/{triadSeason}
@@ -800,343 +1829,8 @@ class ElexonApiClient:
         endpoint_key = "demand/peak/indicative/settlement/{triadSeason}"
         return self.call_endpoint(endpoint_key, path_params={"triadSeason": triadSeason})
 
-    def get_demand_peak_triad(self) -> pd.DataFrame:
-        """
-        GET /demand/peak/triad
-        """
-        endpoint_key = "demand/peak/triad"
-        return self.call_endpoint(endpoint_key)
-
     # ────────────────────────────────────────────────────────────────────────────
-    # 8) Explicit Wrappers for Demand Forecast
-    # ────────────────────────────────────────────────────────────────────────────
-
-    def get_forecast_demand_daily(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/daily
-        """
-        endpoint_key = "forecast/demand/daily"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_daily_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/daily/evolution
-        """
-        endpoint_key = "forecast/demand/daily/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_daily_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/daily/history
-        """
-        endpoint_key = "forecast/demand/daily/history"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead
-        """
-        endpoint_key = "forecast/demand/day-ahead"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_earliest(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/earliest
-        """
-        endpoint_key = "forecast/demand/day-ahead/earliest"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_earliest_stream(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/earliest/stream
-        """
-        endpoint_key = "forecast/demand/day-ahead/earliest/stream"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/evolution
-        """
-        endpoint_key = "forecast/demand/day-ahead/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/history
-        """
-        endpoint_key = "forecast/demand/day-ahead/history"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_latest(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/latest
-        """
-        endpoint_key = "forecast/demand/day-ahead/latest"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_latest_stream(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/latest/stream
-        """
-        endpoint_key = "forecast/demand/day-ahead/latest/stream"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_day_ahead_peak(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/day-ahead/peak
-        """
-        endpoint_key = "forecast/demand/day-ahead/peak"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_total_day_ahead(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/total/day-ahead
-        """
-        endpoint_key = "forecast/demand/total/day-ahead"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_total_week_ahead(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/total/week-ahead
-        """
-        endpoint_key = "forecast/demand/total/week-ahead"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_total_week_ahead_latest(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/total/week-ahead/latest
-        """
-        endpoint_key = "forecast/demand/total/week-ahead/latest"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_weekly(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/weekly
-        """
-        endpoint_key = "forecast/demand/weekly"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_weekly_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/weekly/evolution
-        """
-        endpoint_key = "forecast/demand/weekly/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_demand_weekly_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/demand/weekly/history
-        """
-        endpoint_key = "forecast/demand/weekly/history"
-        return self.call_endpoint(endpoint_key)
-
-    # ────────────────────────────────────────────────────────────────────────────
-    # 9) Explicit Wrappers for Generation
-    # ────────────────────────────────────────────────────────────────────────────
-
-    def get_generation_actual_per_type(self) -> pd.DataFrame:
-        """
-        GET /generation/actual/per-type
-        """
-        endpoint_key = "generation/actual/per-type"
-        return self.call_endpoint(endpoint_key)
-
-    def get_generation_actual_per_type_day_total(self) -> pd.DataFrame:
-        """
-        GET /generation/actual/per-type/day-total
-        """
-        endpoint_key = "generation/actual/per-type/day-total"
-        return self.call_endpoint(endpoint_key)
-
-    def get_generation_actual_per_type_wind_and_solar(self) -> pd.DataFrame:
-        """
-        GET /generation/actual/per-type/wind-and-solar
-        """
-        endpoint_key = "generation/actual/per-type/wind-and-solar"
-        return self.call_endpoint(endpoint_key)
-
-    def get_generation_outturn(self) -> pd.DataFrame:
-        """
-        GET /generation/outturn
-        """
-        endpoint_key = "generation/outturn"
-        return self.call_endpoint(endpoint_key)
-
-    def get_generation_outturn_current(self) -> pd.DataFrame:
-        """
-        GET /generation/outturn/current
-        """
-        endpoint_key = "generation/outturn/current"
-        return self.call_endpoint(endpoint_key)
-
-    def get_generation_outturn_interconnectors(self) -> pd.DataFrame:
-        """
-        GET /generation/outturn/interconnectors
-        """
-        endpoint_key = "generation/outturn/interconnectors"
-        return self.call_endpoint(endpoint_key)
-
-    def get_generation_outturn_summary(self) -> pd.DataFrame:
-        """
-        GET /generation/outturn/summary
-        """
-        endpoint_key = "generation/outturn/summary"
-        return self.call_endpoint(endpoint_key)
-
-    # ────────────────────────────────────────────────────────────────────────────
-    # 10) Explicit Wrappers for Generation Forecast
-    # ────────────────────────────────────────────────────────────────────────────
-
-    def get_forecast_availability_daily(self) -> pd.DataFrame:
-        """
-        GET /forecast/availability/daily
-        """
-        endpoint_key = "forecast/availability/daily"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_availability_daily_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/availability/daily/evolution
-        """
-        endpoint_key = "forecast/availability/daily/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_availability_daily_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/availability/daily/history
-        """
-        endpoint_key = "forecast/availability/daily/history"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_availability_weekly(self) -> pd.DataFrame:
-        """
-        GET /forecast/availability/weekly
-        """
-        endpoint_key = "forecast/availability/weekly"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_availability_weekly_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/availability/weekly/evolution
-        """
-        endpoint_key = "forecast/availability/weekly/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_availability_weekly_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/availability/weekly/history
-        """
-        endpoint_key = "forecast/availability/weekly/history"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_day_ahead(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/day-ahead
-        """
-        endpoint_key = "forecast/generation/day-ahead"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind
-        """
-        endpoint_key = "forecast/generation/wind"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_and_solar_day_ahead(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind-and-solar/day-ahead
-        """
-        endpoint_key = "forecast/generation/wind-and-solar/day-ahead"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_earliest(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/earliest
-        """
-        endpoint_key = "forecast/generation/wind/earliest"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_earliest_stream(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/earliest/stream
-        """
-        endpoint_key = "forecast/generation/wind/earliest/stream"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/evolution
-        """
-        endpoint_key = "forecast/generation/wind/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/history
-        """
-        endpoint_key = "forecast/generation/wind/history"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_latest(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/latest
-        """
-        endpoint_key = "forecast/generation/wind/latest"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_latest_stream(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/latest/stream
-        """
-        endpoint_key = "forecast/generation/wind/latest/stream"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_generation_wind_peak(self) -> pd.DataFrame:
-        """
-        GET /forecast/generation/wind/peak
-        """
-        endpoint_key = "forecast/generation/wind/peak"
-        return self.call_endpoint(endpoint_key)
-
-    # ────────────────────────────────────────────────────────────────────────────
-    # 11) Explicit Wrappers for Health Check
-    # ────────────────────────────────────────────────────────────────────────────
-
-    def get_health(self) -> pd.DataFrame:
-        """
-        GET /health
-        """
-        endpoint_key = "health"
-        return self.call_endpoint(endpoint_key)
-
-    # ────────────────────────────────────────────────────────────────────────────
-    # 12) Explicit Wrappers for Indicated Forecast
-    # ────────────────────────────────────────────────────────────────────────────
-
-    def get_forecast_indicated_day_ahead(self) -> pd.DataFrame:
-        """
-        GET /forecast/indicated/day-ahead
-        """
-        endpoint_key = "forecast/indicated/day-ahead"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_indicated_day_ahead_evolution(self) -> pd.DataFrame:
-        """
-        GET /forecast/indicated/day-ahead/evolution
-        """
-        endpoint_key = "forecast/indicated/day-ahead/evolution"
-        return self.call_endpoint(endpoint_key)
-
-    def get_forecast_indicated_day_ahead_history(self) -> pd.DataFrame:
-        """
-        GET /forecast/indicated/day-ahead/history
-        """
-        endpoint_key = "forecast/indicated/day-ahead/history"
-        return self.call_endpoint(endpoint_key)
-
-    # ────────────────────────────────────────────────────────────────────────────
-    # 13) Explicit Wrappers for Indicative Imbalance Settlement
+    # 8) Explicit Wrappers for Indicative Imbalance Settlement
     # ────────────────────────────────────────────────────────────────────────────
 
     def get_settlement_acceptance_volumes(
@@ -1154,7 +1848,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/acceptance/volumes/all/{bidOffer}/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_acceptances_all(
         self,
@@ -1162,11 +1856,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/acceptances/all/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
-
-    def get_settlement_default_notices(self) -> pd.DataFrame:
-        endpoint_key = "balancing/settlement/default-notices"
-        return self.call_endpoint(endpoint_key)
+        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_indicative_cashflows(
         self,
@@ -1183,7 +1873,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/indicative/cashflows/all/{bidOffer}/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_indicative_volumes(
         self,
@@ -1200,7 +1890,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/indicative/volumes/all/{bidOffer}/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_market_depth(
         self,
@@ -1215,7 +1905,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/market-depth/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_messages(
         self,
@@ -1230,7 +1920,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/messages/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_stack_all(
         self,
@@ -1239,7 +1929,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/stack/all/{bidOffer}/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"bidOffer": bidOffer, "settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_summary(
         self,
@@ -1247,7 +1937,7 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/summary/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
+        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
 
     def get_settlement_system_prices(
         self,
@@ -1262,4 +1952,134 @@ class ElexonApiClient:
         settlementPeriod: int
     ) -> pd.DataFrame:
         endpoint_key = "balancing/settlement/system-prices/{settlementDate}/{settlementPeriod}"
-        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": str(settlementPeriod)})
\ No newline at end of file
+        return self.call_endpoint(endpoint_key, path_params={"settlementDate": settlementDate, "settlementPeriod": _sp_str(settlementPeriod)})
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Generated wrappers: every ENDPOINTS key without a hand-written method above gets
+# a `get_<key>` method, e.g. "datasets/ABUC/stream" -> get_datasets_abuc_stream().
+# URI placeholders become (positional) arguments; any keyword arguments are sent
+# as query params, with a trailing underscore stripped (from_=... -> from=...).
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _method_name(key: str) -> str:
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", _PLACEHOLDER_RE.sub(r"\1", key))
+    return "get_" + re.sub(r"\W+", "_", name).strip("_").lower()
+
+
+# Parameterless wrappers kept under their established names (which don't always
+# match the derived get_<key> name); generated before the catch-all below.
+_SIMPLE_WRAPPERS: Dict[str, str] = {
+    "get_acceptances_all_latest": "balancing/acceptances/all/latest",
+    "get_demand_actual_total": "demand/actual/total",
+    "get_demand_outturn": "demand/outturn",
+    "get_demand_outturn_daily": "demand/outturn/daily",
+    "get_demand_outturn_daily_stream": "demand/outturn/daily/stream",
+    "get_demand_outturn_stream": "demand/outturn/stream",
+    "get_demand_outturn_summary": "demand/outturn/summary",
+    "get_demand_peak": "demand/peak",
+    "get_demand_peak_indicative": "demand/peak/indicative",
+    "get_demand_peak_triad": "demand/peak/triad",
+    "get_forecast_demand_daily": "forecast/demand/daily",
+    "get_forecast_demand_daily_evolution": "forecast/demand/daily/evolution",
+    "get_forecast_demand_daily_history": "forecast/demand/daily/history",
+    "get_forecast_demand_day_ahead": "forecast/demand/day-ahead",
+    "get_forecast_demand_day_ahead_earliest": "forecast/demand/day-ahead/earliest",
+    "get_forecast_demand_day_ahead_earliest_stream": "forecast/demand/day-ahead/earliest/stream",
+    "get_forecast_demand_day_ahead_evolution": "forecast/demand/day-ahead/evolution",
+    "get_forecast_demand_day_ahead_history": "forecast/demand/day-ahead/history",
+    "get_forecast_demand_day_ahead_latest": "forecast/demand/day-ahead/latest",
+    "get_forecast_demand_day_ahead_latest_stream": "forecast/demand/day-ahead/latest/stream",
+    "get_forecast_demand_day_ahead_peak": "forecast/demand/day-ahead/peak",
+    "get_forecast_demand_total_day_ahead": "forecast/demand/total/day-ahead",
+    "get_forecast_demand_total_week_ahead": "forecast/demand/total/week-ahead",
+    "get_forecast_demand_total_week_ahead_latest": "forecast/demand/total/week-ahead/latest",
+    "get_forecast_demand_weekly": "forecast/demand/weekly",
+    "get_forecast_demand_weekly_evolution": "forecast/demand/weekly/evolution",
+    "get_forecast_demand_weekly_history": "forecast/demand/weekly/history",
+    "get_generation_actual_per_type": "generation/actual/per-type",
+    "get_generation_actual_per_type_day_total": "generation/actual/per-type/day-total",
+    "get_generation_actual_per_type_wind_and_solar": "generation/actual/per-type/wind-and-solar",
+    "get_generation_outturn": "generation/outturn",
+    "get_generation_outturn_current": "generation/outturn/current",
+    "get_generation_outturn_interconnectors": "generation/outturn/interconnectors",
+    "get_generation_outturn_summary": "generation/outturn/summary",
+    "get_forecast_availability_daily": "forecast/availability/daily",
+    "get_forecast_availability_daily_evolution": "forecast/availability/daily/evolution",
+    "get_forecast_availability_daily_history": "forecast/availability/daily/history",
+    "get_forecast_availability_weekly": "forecast/availability/weekly",
+    "get_forecast_availability_weekly_evolution": "forecast/availability/weekly/evolution",
+    "get_forecast_availability_weekly_history": "forecast/availability/weekly/history",
+    "get_forecast_generation_day_ahead": "forecast/generation/day-ahead",
+    "get_forecast_generation_wind": "forecast/generation/wind",
+    "get_forecast_generation_wind_and_solar_day_ahead": "forecast/generation/wind-and-solar/day-ahead",
+    "get_forecast_generation_wind_earliest": "forecast/generation/wind/earliest",
+    "get_forecast_generation_wind_earliest_stream": "forecast/generation/wind/earliest/stream",
+    "get_forecast_generation_wind_evolution": "forecast/generation/wind/evolution",
+    "get_forecast_generation_wind_history": "forecast/generation/wind/history",
+    "get_forecast_generation_wind_latest": "forecast/generation/wind/latest",
+    "get_forecast_generation_wind_latest_stream": "forecast/generation/wind/latest/stream",
+    "get_forecast_generation_wind_peak": "forecast/generation/wind/peak",
+    "get_health": "health",
+    "get_forecast_indicated_day_ahead": "forecast/indicated/day-ahead",
+    "get_forecast_indicated_day_ahead_evolution": "forecast/indicated/day-ahead/evolution",
+    "get_forecast_indicated_day_ahead_history": "forecast/indicated/day-ahead/history",
+    "get_settlement_default_notices": "balancing/settlement/default-notices",
+}
+
+
+def _make_wrapper(key: str, method_name: Optional[str] = None):
+    placeholders = _PLACEHOLDER_RE.findall(ENDPOINTS[key])
+
+    def wrapper(self, *args: Any, return_type: Optional[str] = None, **query: Any) -> pd.DataFrame:
+        path_params = dict(zip(placeholders, args))
+        for name in placeholders[len(args):]:
+            if name in query:
+                path_params[name] = query.pop(name)
+        query_params = {k.rstrip("_"): v for k, v in query.items() if v is not None}
+        return self.call_endpoint(
+            key, path_params=path_params, query_params=query_params, return_type=return_type
+        )
+
+    wrapper.__name__ = wrapper.__qualname__ = method_name or _method_name(key)
+    wrapper.__doc__ = f"GET {ENDPOINTS[key]}"
+    wrapper.__signature__ = inspect.Signature(
+        [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        + [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD) for name in placeholders]
+        + [inspect.Parameter("return_type", inspect.Parameter.KEYWORD_ONLY, default=None)]
+        + [inspect.Parameter("query", inspect.Parameter.VAR_KEYWORD)]
+    )
+    return wrapper
+
+
+def _make_iter_wrapper(key: str):
+    placeholders = _PLACEHOLDER_RE.findall(ENDPOINTS[key])
+
+    def wrapper(self, *args: Any, batch_size: int = _STREAM_BATCH_ROWS, **query: Any) -> Iterator[pd.DataFrame]:
+        path_params = dict(zip(placeholders, args))
+        for name in placeholders[len(args):]:
+            if name in query:
+                path_params[name] = query.pop(name)
+        query_params = {k.rstrip("_"): v for k, v in query.items() if v is not None}
+        return self.iter_frames(key, path_params, query_params, batch_size=batch_size)
+
+    wrapper.__name__ = wrapper.__qualname__ = "iter_" + _method_name(key)[len("get_"):]
+    wrapper.__doc__ = f"GET {ENDPOINTS[key]}, yielded as DataFrames of up to batch_size rows"
+    wrapper.__signature__ = inspect.Signature(
+        [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        + [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD) for name in placeholders]
+        + [inspect.Parameter("batch_size", inspect.Parameter.KEYWORD_ONLY, default=_STREAM_BATCH_ROWS)]
+        + [inspect.Parameter("query", inspect.Parameter.VAR_KEYWORD)]
+    )
+    return wrapper
+
+
+for _name, _key in _SIMPLE_WRAPPERS.items():
+    setattr(ElexonApiClient, _name, _make_wrapper(_key, _name))
+for _key in ENDPOINTS:
+    if not hasattr(ElexonApiClient, _method_name(_key)):
+        setattr(ElexonApiClient, _method_name(_key), _make_wrapper(_key))
+    if _key.endswith("/stream"):  # iter_* counterparts of the get_*_stream wrappers
+        _iter = _make_iter_wrapper(_key)
+        setattr(ElexonApiClient, _iter.__name__, _iter)
+del _name, _key, _iter
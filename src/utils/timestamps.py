@@ -0,0 +1,35 @@
+# File: src/utils/timestamps.py
+
+import numpy as np
+import pandas as pd
+
+
+def settlement_to_utc(settlement_date: pd.Series, settlement_period: pd.Series) -> pd.Series:
+    """
+    Build UTC timestamps from a settlementDate / settlementPeriod pair
+    (half-hourly periods, 1-based).
+
+    A day's worth of rows shares a single settlementDate string, so the date
+    parse is memoized (cache=True). The period offsets are added as one NumPy
+    datetime64 + timedelta64 operation on naive values, and the result is
+    tagged UTC once at the end rather than localising element by element.
+    A missing date or period gives NaT.
+    """
+    base = pd.to_datetime(settlement_date, cache=True).to_numpy("datetime64[ns]")
+    periods = settlement_period.to_numpy(dtype="float64", na_value=np.nan)
+    offset = (periods - 1).astype("timedelta64[m]") * 30
+    return pd.Series(
+        pd.DatetimeIndex(base + offset).tz_localize("UTC"), index=settlement_date.index
+    )
+
+
+def parse_utc(timestamps: pd.Series) -> pd.Series:
+    """
+    Parse Elexon ISO 8601 timestamp strings (e.g. startTime, "2024-01-01T00:30:00Z")
+    to tz-aware UTC.
+
+    format="ISO8601" keeps pandas on its C parser instead of guessing a format
+    per element, and cache=True parses each distinct stamp once. Columns the
+    client already converted pass straight through.
+    """
+    return pd.to_datetime(timestamps, format="ISO8601", utc=True, cache=True)
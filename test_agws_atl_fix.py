@@ -3,120 +3,127 @@
 Test script to verify the AGWS and ATL fixes with the latest API response formats.
 """
 
-import pandas as pd
+import os
 from datetime import datetime, timedelta
-from src.fetching.elexon_client import ElexonApiClient
+from functools import lru_cache, partial
+from src.fetching.elexon_client import ElexonApiClient, fetch_or_empty
+from src.utils.timestamps import parse_utc, settlement_to_utc
 
-def test_atl():
+# Set TEST_VERBOSE=1 to also print column lists and sample rows
+VERBOSE = os.getenv("TEST_VERBOSE", "0") == "1"
+
+# A recent date range, computed once so both tests query the identical window
+_now = datetime.utcnow()
+WINDOW = (
+    (_now - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    (_now - timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+)
+
+ATL_KEY = "demand/actual/total"
+AGWS_KEY = "generation/actual/per-type/wind-and-solar"
+
+@lru_cache(maxsize=None)
+def _get_client():
+    """One client shared by the tests in this script."""
+    return ElexonApiClient()
+
+def _fetch(key):
+    """The endpoint over WINDOW; a failed request is printed and gives an empty frame."""
+    from_date, to_date = WINDOW
+    return fetch_or_empty(
+        _get_client(), key, query_params={"from": from_date, "to": to_date}, on_error=print
+    )
+
+def test_atl(df_atl=None):
     """Test the Actual Total Load endpoint."""
     print("\n===== Testing Actual Total Load (ATL) =====")
-    client = ElexonApiClient()
-    
-    # Use a recent date range
-    from_date = (datetime.utcnow() - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
-    to_date = (datetime.utcnow() - timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
-    
+    from_date, to_date = WINDOW
     print(f"Date range: {from_date} to {to_date}")
     
-    # Use the demand/actual/total endpoint
-    df_atl = client.call_endpoint(
-        "demand/actual/total",
-        query_params={"from": from_date, "to": to_date}
-    )
+    # Use the demand/actual/total endpoint, unless the frame was fetched up front
+    if df_atl is None:
+        df_atl = _fetch(ATL_KEY)
     
     print(f"ATL DataFrame shape: {df_atl.shape}")
     if not df_atl.empty:
-        print(f"ATL columns: {df_atl.columns.tolist()}")
-        print("First row:")
-        print(df_atl.iloc[0])
+        if VERBOSE:
+            print(f"ATL columns: {df_atl.columns.tolist()}")
+            print("First row:")
+            print(df_atl.iloc[0])
         
         # Process timestamps
         if "startTime" in df_atl.columns:
-            df_atl["ts"] = pd.to_datetime(df_atl["startTime"], utc=True)
+            df_atl["ts"] = parse_utc(df_atl["startTime"])
         elif "local_datetime" in df_atl.columns:
-            df_atl["ts"] = pd.to_datetime(df_atl["local_datetime"], utc=True)
+            df_atl["ts"] = parse_utc(df_atl["local_datetime"])
         else:
-            df_atl["settDate"] = pd.to_datetime(df_atl["settlementDate"])
-            df_atl["ts"] = (
-                df_atl["settDate"]
-                + pd.to_timedelta((df_atl["settlementPeriod"] - 1) * 30, unit="m")
-            )
-            df_atl["ts"] = df_atl["ts"].dt.tz_localize("UTC")
+            df_atl["ts"] = settlement_to_utc(df_atl["settlementDate"], df_atl["settlementPeriod"])
         
-        print("\nProcessed dataframe:")
-        print(df_atl[["ts", "quantity"]].head())
+        if VERBOSE:
+            print("\nProcessed dataframe:")
+            print(df_atl[["ts", "quantity"]].head())
     else:
         print("WARNING: No ATL data returned")
 
-def test_agws():
+def test_agws(df_agws=None):
     """Test the Actual Wind & Solar Generation endpoint."""
     print("\n===== Testing Actual Wind & Solar Generation (AGWS) =====")
-    client = ElexonApiClient()
-    
-    # Use a recent date range
-    from_date = (datetime.utcnow() - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
-    to_date = (datetime.utcnow() - timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
-    
+    from_date, to_date = WINDOW
     print(f"Date range: {from_date} to {to_date}")
     
-    # Use the generation/actual/per-type/wind-and-solar endpoint
-    df_agws = client.call_endpoint(
-        "generation/actual/per-type/wind-and-solar",
-        query_params={"from": from_date, "to": to_date}
-    )
+    # Use the generation/actual/per-type/wind-and-solar endpoint, unless the frame was fetched up front
+    if df_agws is None:
+        df_agws = _fetch(AGWS_KEY)
     
     print(f"AGWS DataFrame shape: {df_agws.shape}")
     if not df_agws.empty:
-        print(f"AGWS columns: {df_agws.columns.tolist()}")
-        print("First row:")
-        print(df_agws.iloc[0])
+        if VERBOSE:
+            print(f"AGWS columns: {df_agws.columns.tolist()}")
+            print("First row:")
+            print(df_agws.iloc[0])
         
         # Process timestamps
         if "startTime" in df_agws.columns:
-            df_agws["ts"] = pd.to_datetime(df_agws["startTime"], utc=True)
+            df_agws["ts"] = parse_utc(df_agws["startTime"])
         elif "local_datetime" in df_agws.columns:
-            df_agws["ts"] = pd.to_datetime(df_agws["local_datetime"], utc=True)
+            df_agws["ts"] = parse_utc(df_agws["local_datetime"])
         else:
-            df_agws["settDate"] = pd.to_datetime(df_agws["settlementDate"])
-            df_agws["ts"] = (
-                df_agws["settDate"]
-                + pd.to_timedelta((df_agws["settlementPeriod"] - 1) * 30, unit="m")
-            )
-            df_agws["ts"] = df_agws["ts"].dt.tz_localize("UTC")
+            df_agws["ts"] = settlement_to_utc(df_agws["settlementDate"], df_agws["settlementPeriod"])
         
         # Process the wind and solar data
         if "businessType" in df_agws.columns and "psrType" in df_agws.columns:
             print("\nProcessing by psrType...")
             # Create a pivot table
-            df_agws_reset = df_agws.reset_index()
-            pivot_agws = df_agws_reset.pivot_table(
-                values="quantity", 
-                index="ts", 
-                columns="psrType", 
-                aggfunc="sum"
-            ).fillna(0)
+            psr_type = df_agws["psrType"].astype("category")
+            pivot_agws = (
+                df_agws.groupby(["ts", psr_type], observed=True)["quantity"]
+                .sum()
+                .unstack("psrType", fill_value=0)
+            )
             
-            print("\nPivot table:")
-            print(pivot_agws.head())
+            if VERBOSE:
+                print("\nPivot table:")
+                print(pivot_agws.head())
             
             # Create combined columns
-            if "Wind Offshore" in pivot_agws.columns and "Wind Onshore" in pivot_agws.columns:
-                pivot_agws["Wind Total"] = pivot_agws["Wind Offshore"] + pivot_agws["Wind Onshore"]
-            
-            if "Solar" in pivot_agws.columns:
-                if "Wind Total" in pivot_agws.columns:
-                    pivot_agws["Wind+Solar"] = pivot_agws["Wind Total"] + pivot_agws["Solar"]
-                elif "Wind Offshore" in pivot_agws.columns and "Wind Onshore" in pivot_agws.columns:
-                    pivot_agws["Wind+Solar"] = pivot_agws["Wind Offshore"] + pivot_agws["Wind Onshore"] + pivot_agws["Solar"]
+            if {"Wind Offshore", "Wind Onshore"} <= set(pivot_agws.columns):
+                wind = pivot_agws[["Wind Offshore", "Wind Onshore"]].to_numpy().sum(axis=1)
+                pivot_agws["Wind Total"] = wind
+                if "Solar" in pivot_agws.columns:
+                    pivot_agws["Wind+Solar"] = wind + pivot_agws["Solar"].to_numpy()
             
-            print("\nProcessed pivot table:")
-            print(pivot_agws.head())
+            if VERBOSE:
+                print("\nProcessed pivot table:")
+                print(pivot_agws.head())
         else:
-            print("\nSimple quantity processing:")
-            print(df_agws[["ts", "quantity"]].head())
+            if VERBOSE:
+                print("\nSimple quantity processing:")
+                print(df_agws[["ts", "quantity"]].head())
     else:
         print("WARNING: No AGWS data returned")
 
 if __name__ == "__main__":
-    test_atl()
-    test_agws()
+    # Both endpoints share WINDOW, so fetch them concurrently
+    df_atl, df_agws = _get_client().fetch_many([partial(_fetch, ATL_KEY), partial(_fetch, AGWS_KEY)])
+    test_atl(df_atl)
+    test_agws(df_agws)
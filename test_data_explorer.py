@@ -3,9 +3,44 @@
 Test script to validate the Data Explorer implementation with the Elexon API client fixes
 """
 
+import os
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from src.categories.data_explorer import ElexonApiClient
+from src.fetching.elexon_client import fetch_or_empty
+
+# Set TEST_VERBOSE=1 to also print column lists and sample rows
+VERBOSE = os.getenv("TEST_VERBOSE", "0") == "1"
+
+def _expand_fuelhh(df_fuel):
+    """Flatten FUELHH's nested 'data' column to one row per fuel type."""
+    if 'data' not in df_fuel.columns or not pd.api.types.is_list_like(df_fuel.iloc[0]['data']):
+        return
+    print("\nExpanding nested 'data' column...")
+    # One row per item of each period's 'data' list
+    exp = (
+        df_fuel[['startTime', 'settlementPeriod', 'data']]
+        .explode('data')
+        .dropna(subset=['data'])
+        .reset_index(drop=True)
+    )
+    expanded_df = pd.concat(
+        [exp.drop(columns='data'), pd.json_normalize(exp['data'].tolist())], axis=1
+    )
+    print(f"Expanded DataFrame shape: {expanded_df.shape}")
+    if VERBOSE:
+        print(f"Expanded columns: {expanded_df.columns.tolist()}")
+        print("Sample of expanded data:")
+        print(expanded_df.head(3))
+
+
+# (name, heading, endpoint path, extra processing or None)
+ENDPOINTS = [
+    ("ATL", "Actual Total Load using demand/actual/total", "demand/actual/total", None),
+    ("AGWS", "Actual Wind & Solar Generation", "generation/actual/per-type/wind-and-solar", None),
+    ("FUELHH", "Fuel-Type Generation Outturn", "generation/actual/per-type", _expand_fuelhh),
+]
 
 def test_data_explorer_endpoints():
     """Test the endpoints used in data_explorer.py to verify they work correctly."""
@@ -14,76 +49,39 @@ def test_data_explorer_endpoints():
     # Initialize the client
     client = ElexonApiClient()
     
-    # Set up the date range for testing
-    today = datetime.now()
-    from_date = (today - timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
-    to_date = today.strftime("%Y-%m-%dT23:59:59Z")
+    # Set up the date range for testing, ending now (Elexon rejects future dates)
+    now = datetime.now(timezone.utc)
+    from_date = (now - timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
+    to_date = now.strftime("%Y-%m-%dT%H:%M:%SZ")
     
-    # Test 1: Actual Total Load using demand/actual/total
-    print("\n===== Test 1: Actual Total Load using demand/actual/total =====")
-    df_atl = client.call_endpoint(
-        "demand/actual/total",
-        query_params={"from": from_date, "to": to_date}
-    )
-    print(f"ATL DataFrame shape: {df_atl.shape}")
-    if not df_atl.empty:
-        print(f"ATL columns: {df_atl.columns.tolist()}")
-        print("Sample data:")
-        print(df_atl.head(3))
-    else:
-        print("WARNING: No ATL data returned")
+    # Fetch all endpoints concurrently, then run the same checks over each; a
+    # failed one comes back empty and is reported as FAILED
+    window = {"from": from_date, "to": to_date}
+    frames = client.fetch_many([
+        partial(fetch_or_empty, client, path, query_params=window, on_error=print)
+        for _, _, path, _ in ENDPOINTS
+    ])
+    results = {}
     
-    # Test 2: Actual Wind & Solar Generation
-    print("\n===== Test 2: Actual Wind & Solar Generation =====")
-    df_agws = client.call_endpoint(
-        "generation/actual/per-type/wind-and-solar",
-        query_params={"from": from_date, "to": to_date}
-    )
-    print(f"AGWS DataFrame shape: {df_agws.shape}")
-    if not df_agws.empty:
-        print(f"AGWS columns: {df_agws.columns.tolist()}")
-        print("Sample data:")
-        print(df_agws.head(3))
-    else:
-        print("WARNING: No AGWS data returned")
-    
-    # Test 3: Fuel-Type Generation Outturn
-    print("\n===== Test 3: Fuel-Type Generation Outturn =====")
-    df_fuel = client.call_endpoint(
-        "generation/actual/per-type",
-        query_params={"from": from_date, "to": to_date}
-    )
-    print(f"FUELHH DataFrame shape: {df_fuel.shape}")
-    if not df_fuel.empty:
-        print(f"FUELHH columns: {df_fuel.columns.tolist()}")
-        print("Sample data:")
-        print(df_fuel.head(3))
-        
-        # Test the data expansion for the FUELHH data
-        if 'data' in df_fuel.columns and isinstance(df_fuel.iloc[0]['data'], list):
-            print("\nExpanding nested 'data' column...")
-            # Extract the list of dicts from the 'data' column
-            expanded_data = []
-            for idx, row in df_fuel.iterrows():
-                base_data = {'startTime': row['startTime'], 'settlementPeriod': row['settlementPeriod']}
-                for item in row['data']:
-                    entry = base_data.copy()
-                    entry.update(item)
-                    expanded_data.append(entry)
-            
-            expanded_df = pd.DataFrame(expanded_data)
-            print(f"Expanded DataFrame shape: {expanded_df.shape}")
-            print(f"Expanded columns: {expanded_df.columns.tolist()}")
-            print("Sample of expanded data:")
-            print(expanded_df.head(3))
-    else:
-        print("WARNING: No FUELHH data returned")
+    for i, ((name, heading, _, process), df) in enumerate(zip(ENDPOINTS, frames), start=1):
+        print(f"\n===== Test {i}: {heading} =====")
+        print(f"{name} DataFrame shape: {df.shape}")
+        if not df.empty:
+            if VERBOSE:
+                print(f"{name} columns: {df.columns.tolist()}")
+                print("Sample data:")
+                print(df.head(3))
+            if process is not None:
+                process(df)
+        else:
+            print(f"WARNING: No {name} data returned")
+        results[name] = df
     
     # Summary
     print("\n===== Summary =====")
-    print(f"ATL: {'SUCCESS' if not df_atl.empty else 'FAILED'}")
-    print(f"AGWS: {'SUCCESS' if not df_agws.empty else 'FAILED'}")
-    print(f"FUELHH: {'SUCCESS' if not df_fuel.empty else 'FAILED'}")
+    for name, df in results.items():
+        print(f"{name}: {'SUCCESS' if not df.empty else 'FAILED'}")
+    df_fuel = results["FUELHH"]
     print(f"FUELHH Expansion: {'SUCCESS' if not df_fuel.empty and 'data' in df_fuel.columns else 'FAILED or N/A'}")
 
 if __name__ == "__main__":
@@ -6,9 +6,15 @@ Test script to verify the fixed Elexon API client implementation with the three
 3. Fuel-Type Generation Outturn (FUELHH / B1630)
 """
 
+import os
 import pandas as pd
 from datetime import datetime, timedelta
-from src.fetching.elexon_client import ElexonApiClient
+from functools import partial
+from src.fetching.elexon_client import ElexonApiClient, fetch_or_empty
+from src.utils.timestamps import parse_utc, settlement_to_utc
+
+# Set TEST_VERBOSE=1 to also print column lists and sample rows
+VERBOSE = os.getenv("TEST_VERBOSE", "0") == "1"
 
 def main():
     """Test the fixed Elexon API client implementation with problematic endpoints."""
@@ -21,85 +27,78 @@ def main():
     from_date = "2024-01-01T00:00:00Z"
     to_date = "2024-01-02T23:59:59Z"
     
+    # Fetch the three endpoints concurrently; a failed one comes back empty so
+    # the tests below still report on the others
+    window = {"from": from_date, "to": to_date}
+    df_atl, df_agws, df_fuelhh = client.fetch_many([
+        partial(fetch_or_empty, client, key, query_params=window, on_error=print)
+        for key in (
+            "demand/actual/total",
+            "generation/actual/per-type/wind-and-solar",
+            "generation/actual/per-type",
+        )
+    ])
+    
     # Test 1: Actual Total Load (ATL) using demand/actual/total endpoint
     print("\n===== Test 1: Actual Total Load using demand/actual/total =====")
-    df_atl = client.call_endpoint(
-        "demand/actual/total",
-        query_params={"from": from_date, "to": to_date}
-    )
     print(f"ATL DataFrame shape: {df_atl.shape}")
     if not df_atl.empty:
-        print(f"ATL columns: {df_atl.columns.tolist()}")
-        print("First row:")
-        print(df_atl.iloc[0])
+        if VERBOSE:
+            print(f"ATL columns: {df_atl.columns.tolist()}")
+            print("First row:")
+            print(df_atl.iloc[0])
         
         # Process timestamps for plotting
         if "startTime" in df_atl.columns:
-            df_atl["ts"] = pd.to_datetime(df_atl["startTime"], utc=True)
+            df_atl["ts"] = parse_utc(df_atl["startTime"])
             print("\nTimestamps successfully processed using 'startTime'")
         elif "local_datetime" in df_atl.columns:
-            df_atl["ts"] = pd.to_datetime(df_atl["local_datetime"], utc=True)
+            df_atl["ts"] = parse_utc(df_atl["local_datetime"])
             print("\nTimestamps successfully processed using 'local_datetime'")
         else:
-            df_atl["settDate"] = pd.to_datetime(df_atl["settlementDate"])
-            df_atl["ts"] = (
-                df_atl["settDate"]
-                + pd.to_timedelta((df_atl["settlementPeriod"] - 1) * 30, unit="m")
-            )
-            df_atl["ts"] = df_atl["ts"].dt.tz_localize("UTC")
+            df_atl["ts"] = settlement_to_utc(df_atl["settlementDate"], df_atl["settlementPeriod"])
             print("\nTimestamps successfully processed using 'settlementDate' and 'settlementPeriod'")
     else:
         print("WARNING: No ATL data returned")
     
     # Test 2: Actual Wind & Solar Generation (AGWS)
     print("\n===== Test 2: Actual Wind & Solar Generation =====")
-    df_agws = client.call_endpoint(
-        "generation/actual/per-type/wind-and-solar",
-        query_params={"from": from_date, "to": to_date}
-    )
     print(f"AGWS DataFrame shape: {df_agws.shape}")
     if not df_agws.empty:
-        print(f"AGWS columns: {df_agws.columns.tolist()}")
-        print("First row:")
-        print(df_agws.iloc[0])
+        if VERBOSE:
+            print(f"AGWS columns: {df_agws.columns.tolist()}")
+            print("First row:")
+            print(df_agws.iloc[0])
         
         # Process the different response structure
         if "businessType" in df_agws.columns and "psrType" in df_agws.columns:
             print("\nProcessing AGWS data with businessType and psrType...")
             # Process timestamps
             if "startTime" in df_agws.columns:
-                df_agws["ts"] = pd.to_datetime(df_agws["startTime"], utc=True)
+                df_agws["ts"] = parse_utc(df_agws["startTime"])
             elif "local_datetime" in df_agws.columns:
-                df_agws["ts"] = pd.to_datetime(df_agws["local_datetime"], utc=True)
+                df_agws["ts"] = parse_utc(df_agws["local_datetime"])
             else:
-                df_agws["settDate"] = pd.to_datetime(df_agws["settlementDate"])
-                df_agws["ts"] = (
-                    df_agws["settDate"]
-                    + pd.to_timedelta((df_agws["settlementPeriod"] - 1) * 30, unit="m")
-                )
-                df_agws["ts"] = df_agws["ts"].dt.tz_localize("UTC")
+                df_agws["ts"] = settlement_to_utc(df_agws["settlementDate"], df_agws["settlementPeriod"])
                 
             # Create a pivot table
-            df_agws_reset = df_agws.reset_index() if df_agws.index.name == 'ts' else df_agws
-            pivot_agws = df_agws_reset.pivot_table(
-                values="quantity", 
-                index="ts", 
-                columns="psrType", 
-                aggfunc="sum"
-            ).fillna(0)
+            psr_type = df_agws["psrType"].astype("category")
+            pivot_agws = (
+                df_agws.groupby(["ts", psr_type], observed=True)["quantity"]
+                .sum()
+                .unstack("psrType", fill_value=0)
+            )
             
             print("\nPivot table shape:", pivot_agws.shape)
-            print("Pivot table columns:", pivot_agws.columns.tolist())
+            if VERBOSE:
+                print("Pivot table columns:", pivot_agws.columns.tolist())
             
             # Create combined totals
-            if "Wind Offshore" in pivot_agws.columns and "Wind Onshore" in pivot_agws.columns:
-                pivot_agws["Wind Total"] = pivot_agws["Wind Offshore"] + pivot_agws["Wind Onshore"]
-            
-            if "Solar" in pivot_agws.columns:
-                if "Wind Total" in pivot_agws.columns:
-                    pivot_agws["Wind+Solar"] = pivot_agws["Wind Total"] + pivot_agws["Solar"]
-                elif "Wind Offshore" in pivot_agws.columns and "Wind Onshore" in pivot_agws.columns:
-                    pivot_agws["Wind+Solar"] = pivot_agws["Wind Offshore"] + pivot_agws["Wind Onshore"] + pivot_agws["Solar"]
+            if {"Wind Offshore", "Wind Onshore"} <= set(pivot_agws.columns):
+                wind = pivot_agws[["Wind Offshore", "Wind Onshore"]].to_numpy().sum(axis=1)
+                pivot_agws["Wind Total"] = wind
+                if "Solar" in pivot_agws.columns:
+                    pivot_agws["Wind+Solar"] = wind + pivot_agws["Solar"].to_numpy()
             
             print("\nAGWS successfully processed with combined totals")
     else:
@@ -107,33 +106,31 @@ def main():
     
     # Test 3: Fuel-Type Generation Outturn (FUELHH)
     print("\n===== Test 3: Fuel-Type Generation Outturn =====")
-    df_fuelhh = client.call_endpoint(
-        "generation/actual/per-type",
-        query_params={"from": from_date, "to": to_date}
-    )
     print(f"FUELHH DataFrame shape: {df_fuelhh.shape}")
     if not df_fuelhh.empty:
-        print(f"FUELHH columns: {df_fuelhh.columns.tolist()}")
-        print("First row:")
-        print(df_fuelhh.iloc[0])
+        if VERBOSE:
+            print(f"FUELHH columns: {df_fuelhh.columns.tolist()}")
+            print("First row:")
+            print(df_fuelhh.iloc[0])
         
         # Check if the response has a nested 'data' column that needs processing
-        if 'data' in df_fuelhh.columns and isinstance(df_fuelhh.iloc[0]['data'], list):
+        if 'data' in df_fuelhh.columns and pd.api.types.is_list_like(df_fuelhh.iloc[0]['data']):
             print("\nExpanding nested 'data' column...")
-            # Extract the list of dicts from the 'data' column
-            expanded_data = []
-            for idx, row in df_fuelhh.iterrows():
-                base_data = {'startTime': row['startTime'], 'settlementPeriod': row['settlementPeriod']}
-                for item in row['data']:
-                    entry = base_data.copy()
-                    entry.update(item)
-                    expanded_data.append(entry)
-            
-            expanded_df = pd.DataFrame(expanded_data)
+            # One row per item of each period's 'data' list
+            exp = (
+                df_fuelhh[['startTime', 'settlementPeriod', 'data']]
+                .explode('data')
+                .dropna(subset=['data'])
+                .reset_index(drop=True)
+            )
+            expanded_df = pd.concat(
+                [exp.drop(columns='data'), pd.json_normalize(exp['data'].tolist())], axis=1
+            )
             print(f"Expanded DataFrame shape: {expanded_df.shape}")
-            print(f"Expanded columns: {expanded_df.columns.tolist()}")
-            print("First few rows of expanded data:")
-            print(expanded_df.head())
+            if VERBOSE:
+                print(f"Expanded columns: {expanded_df.columns.tolist()}")
+                print("First few rows of expanded data:")
+                print(expanded_df.head())
     else:
         print("WARNING: No FUELHH data returned")
     